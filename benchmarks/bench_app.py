@@ -0,0 +1,128 @@
+"""Headless benchmark of pac_app.py against an in-memory Supabase.
+
+Drives the app with Streamlit's AppTest. ``supabase.create_client`` is patched
+to return a seeded ``FakeSupabase``, so no network or Supabase project is
+needed. Each scenario is one script run; scenarios pick a view through the
+``nav`` session key, as the navigation radio does. For each run it reports
+wall time, the Supabase queries made (by table and operation), peak Python
+memory (tracemalloc), and the per-section render times recorded by
+pac.instrumentation. Times are the best of ``--repeat`` runs; query counts
+are those of the first run of each scenario.
+
+The scenarios only read. AppTest runs every click as a full script run, so
+the meeting-detail write buttons that end in ``st.rerun(scope="fragment")``
+raise ``StreamlitInvalidLayoutContextError`` under it and cannot be driven
+from here::
+
+    python benchmarks/bench_app.py [--meetings 500] [--actions 20000] [--repeat 3] [--json out.json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from unittest import mock
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent
+sys.path.insert(0, str(HERE))
+sys.path.insert(0, str(ROOT))
+
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from seed import seed  # noqa: E402
+
+
+def first(rows, **match):
+    return next(r for r in rows if all(r.get(k) == v for k, v in match.items()))
+
+
+def scenarios(db):
+    meetings = db.tables["pac_meetings"]
+    active = first(meetings, status="open") if any(m["status"] == "open" for m in meetings) else meetings[-1]
+    # The archive lists newest first, so the newest finalised meeting is on page 1.
+    archived = first(meetings[::-1], status="finalised")
+    return [
+        ("cold start", True, {}),
+        ("warm rerun", False, {}),
+        ("open meeting", False, {"view": "meeting", "selected_meeting": active["id"]}),
+        ("action register p2", False, {"nav": "actions", "reg_pending_page": 2}),
+        ("upcoming", False, {"nav": "upcoming"}),
+        ("archive p3", False, {"nav": "archive", "view": None, "selected_meeting": None, "arc_page": 3}),
+        ("archive open entry", False, {"arc_page": 1, f"arc_open_{archived['id']}": True}),
+        ("search", False, {"nav": "meetings", "search_q": "leave policy"}),
+        ("admin", False, {"search_q": "", "is_admin": True}),
+    ]
+
+
+def last_metrics(path):
+    try:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return {}
+    return json.loads(lines[-1]) if lines else {}
+
+
+def run_scenario(at, db, metrics_log, cold, state):
+    if cold:
+        st.cache_resource.clear()
+        st.cache_data.clear()
+    for key, value in state.items():
+        at.session_state[key] = value
+    db.reset_calls()
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    if at.exception:
+        raise RuntimeError(f"app raised: {at.exception[0].value}")
+    return {"ms": elapsed, "queries": db.query_count(), "by_table": {f"{t}.{op}": n for (t, op), n in db.calls.items()},
+            "peak_kb": peak / 1024, "sections": last_metrics(metrics_log).get("sections", {})}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=500)
+    parser.add_argument("--actions", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario; the best is reported")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    t = time.perf_counter()
+    db = seed(args.meetings, args.actions)
+    print(f"Seeded {args.meetings} meetings, {args.actions} actions in {time.perf_counter() - t:.1f}s")
+
+    metrics_log = os.path.join(tempfile.mkdtemp(prefix="pac-bench-"), "metrics.jsonl")
+    at = AppTest.from_file(str(ROOT / "pac_app.py"), default_timeout=args.timeout)
+    at.secrets["SUPABASE_URL"] = "http://fake.local"
+    at.secrets["SUPABASE_KEY"] = "fake"
+    at.secrets["ANTHROPIC_API_KEY"] = "fake"
+    at.secrets["PAC_METRICS_LOG"] = metrics_log
+
+    results = {}
+    tracemalloc.start()
+    with mock.patch("supabase.create_client", return_value=db):
+        for name, cold, state in scenarios(db):
+            runs = [run_scenario(at, db, metrics_log, cold, state) for _ in range(1 if cold else args.repeat)]
+            # Best time, but the queries of the first run: repeats are served from the cache.
+            results[name] = {**min(runs, key=lambda r: r["ms"]), "queries": runs[0]["queries"], "by_table": runs[0]["by_table"]}
+    tracemalloc.stop()
+
+    print(f"\n{'scenario':<22}{'ms':>9}{'queries':>9}{'peak MB':>9}   sections (ms)")
+    for name, r in results.items():
+        sections = ", ".join(f"{k} {v:.0f}" for k, v in r["sections"].items())
+        print(f"{name:<22}{r['ms']:>9.0f}{r['queries']:>9}{r['peak_kb'] / 1024:>9.1f}   {sections}")
+        if r["queries"]:
+            print(f"{'':<22}   " + ", ".join(f"{k}×{n}" for k, n in sorted(r["by_table"].items())))
+    if args.json:
+        Path(args.json).write_text(json.dumps({"meetings": args.meetings, "actions": args.actions, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
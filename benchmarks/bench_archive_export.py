@@ -0,0 +1,47 @@
+"""Benchmark: bulk archive export time, queries and peak memory by archive size.
+
+Exports every finalised meeting of a seeded in-memory Supabase (see
+fake_supabase.py) to a temporary ZIP with ``pac.archive_export``, for each
+archive size given. Peak Python memory (tracemalloc) should grow only by the
+ZIP's central directory as the number of meetings grows::
+
+    python benchmarks/bench_archive_export.py [--meetings 100 400 1600] [--batch 100]
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+sys.path.insert(0, str(HERE.parent))
+
+from pac.archive_export import export_archive  # noqa: E402
+from seed import seed  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, nargs="+", default=[100, 400, 1600])
+    parser.add_argument("--actions-per-meeting", type=int, default=40)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    print(f"{'meetings':>9}{'exported':>10}{'ms':>9}{'queries':>9}{'ZIP MB':>9}{'peak MB':>9}")
+    for n in args.meetings:
+        db = seed(n, n * args.actions_per_meeting)
+        with tempfile.TemporaryFile() as out:
+            tracemalloc.start()
+            start = time.perf_counter()
+            exported = export_archive(db, out, batch=args.batch)
+            elapsed = (time.perf_counter() - start) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            size = out.tell()
+        print(f"{n:>9}{exported:>10}{elapsed:>9.0f}{db.query_count():>9}{size / 1e6:>9.1f}{peak / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
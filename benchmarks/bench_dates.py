@@ -0,0 +1,92 @@
+"""Micro-benchmark: date handling in the meeting-card and action-row render loops.
+
+Builds the same markdown strings the All Meetings cards and the Action
+Register rows do, for 1,000 meetings and 10,000 actions by default, once with
+the previous strptime-per-call ``fmt_date`` and overdue check and once with
+``pac.dates`` / ``pac.actions``. Run from the repository root::
+
+    python benchmarks/bench_dates.py [--meetings 1000] [--actions 10000] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pac.actions import cutoff, is_overdue  # noqa: E402
+from pac.dates import fmt_date  # noqa: E402
+
+
+def legacy_fmt_date(d):
+    if not d:
+        return "—"
+    try:
+        return datetime.strptime(str(d)[:10], "%Y-%m-%d").strftime("%-d %B %Y")
+    except:  # noqa: E722
+        return str(d)[:10]
+
+
+def legacy_overdue(a):
+    if a.get("due_date"):
+        try:
+            return datetime.strptime(str(a["due_date"])[:10], "%Y-%m-%d").date() < date.today()
+        except:  # noqa: E722
+            pass
+    return False
+
+
+def seed(n_meetings, n_actions, rng):
+    start = date.today() - timedelta(days=365 * 5)
+    meetings = [{"id": i, "meeting_date": str(start + timedelta(days=rng.randrange(365 * 6))),
+                 "meeting_type": rng.choice(["Ordinary", "Extraordinary"]), "location": "LBU Meeting Room",
+                 "chair": "Chair", "start_time": "09:30:00", "status": rng.choice(["upcoming", "open", "draft", "finalised"])}
+                for i in range(n_meetings)]
+    actions = [{"id": i, "meeting_id": rng.randrange(n_meetings), "action": f"Action {i}", "responsible_person": f"Person {i % 40}",
+                "status": rng.choice(["Pending", "In Progress", "Complete"]),
+                "due_date": str(start + timedelta(days=rng.randrange(365 * 6))) if rng.random() > 0.05 else None}
+               for i in range(n_actions)]
+    return meetings, actions
+
+
+def render(meetings, actions, fmt, overdue):
+    by_id = {m["id"]: m for m in meetings}
+    out = []
+    for m in meetings:
+        out.append(f"📋 {m['meeting_type']} Meeting — {fmt(m['meeting_date'])} ⏰ {m['start_time'][:5]} 📍 {m['location']}")
+    for a in actions:
+        am = by_id[a["meeting_id"]]
+        flag = " 🔴 OVERDUE" if a["status"] != "Complete" and overdue(a) else ""
+        out.append(f"{a['action']}{flag} 👤 {a['responsible_person']} 📅 Due: {fmt(a['due_date'])} Meeting: {am['meeting_type']} {fmt(am['meeting_date'])}")
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=1000)
+    parser.add_argument("--actions", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    meetings, actions = seed(args.meetings, args.actions, random.Random(args.seed))
+    today_iso = cutoff()
+    variants = {
+        "legacy (strptime per call)": lambda: render(meetings, actions, legacy_fmt_date, legacy_overdue),
+        "pac.dates (memoised)": lambda: render(meetings, actions, fmt_date, lambda a: is_overdue(a, today_iso)),
+    }
+    assert variants["legacy (strptime per call)"]() == variants["pac.dates (memoised)"](), "outputs differ"
+
+    print(f"{args.meetings} meetings, {args.actions} actions, best of {args.repeat}")
+    results = {}
+    for name, fn in variants.items():
+        results[name] = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f"  {name:<28} {results[name] * 1000:8.1f} ms")
+    legacy, new = results.values()
+    print(f"  speed-up {legacy / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
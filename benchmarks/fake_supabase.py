@@ -0,0 +1,257 @@
+"""In-memory stand-in for the parts of the Supabase client pac_app.py uses.
+
+Supports ``table(name)`` with ``select`` (with ``count="exact"``), ``insert``,
+``update``, ``upsert`` and ``delete``; the filters ``eq``, ``neq``, ``in_``,
+``gte``, ``lte`` and ``or_``; ``order`` (``desc``/``nullsfirst``), ``range``
+and ``limit``; and the ``pac_delete_meeting``, ``pac_search``,
+``pac_action_counts`` and ``pac_reorder_agenda`` RPCs. Every ``execute()`` is
+counted in ``FakeSupabase.calls`` so benchmarks can report query counts
+without any network.
+"""
+import itertools
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+
+
+class Response:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+def _cmp_value(v):
+    return "" if v is None else str(v)
+
+
+class Query:
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.columns = None
+        self.count = None
+        self.payload = None
+        self.filters = []
+        self.orders = []
+        self.window = None
+
+    # ── operations ──
+    def select(self, columns="*", count=None):
+        self.op, self.count = "select", count
+        self.columns = None if columns.strip() == "*" else [c.strip() for c in columns.split(",")]
+        return self
+
+    def insert(self, rows):
+        self.op, self.payload = "insert", rows
+        return self
+
+    def update(self, values):
+        self.op, self.payload = "update", values
+        return self
+
+    def upsert(self, rows):
+        self.op, self.payload = "upsert", rows
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    # ── filters ──
+    def eq(self, col, val):
+        self.filters.append(lambda r: _cmp_value(r.get(col)) == _cmp_value(val))
+        return self
+
+    def neq(self, col, val):
+        self.filters.append(lambda r: _cmp_value(r.get(col)) != _cmp_value(val))
+        return self
+
+    def in_(self, col, values):
+        wanted = {_cmp_value(v) for v in values}
+        self.filters.append(lambda r: _cmp_value(r.get(col)) in wanted)
+        return self
+
+    def gte(self, col, val):
+        self.filters.append(lambda r: r.get(col) is not None and str(r.get(col)) >= str(val))
+        return self
+
+    def lte(self, col, val):
+        self.filters.append(lambda r: r.get(col) is not None and str(r.get(col)) <= str(val))
+        return self
+
+    def or_(self, expr):
+        # e.g. "status.is.null,status.neq.Complete"
+        tests = []
+        for part in expr.split(","):
+            col, op, val = part.split(".", 2)
+            if op == "is" and val == "null":
+                tests.append(lambda r, col=col: r.get(col) is None)
+            elif op == "eq":
+                tests.append(lambda r, col=col, val=val: _cmp_value(r.get(col)) == val)
+            elif op == "neq":
+                tests.append(lambda r, col=col, val=val: r.get(col) is not None and _cmp_value(r.get(col)) != val)
+            else:
+                raise NotImplementedError(part)
+        self.filters.append(lambda r: any(t(r) for t in tests))
+        return self
+
+    def order(self, col, desc=False, nullsfirst=None):
+        self.orders.append((col, desc, desc if nullsfirst is None else nullsfirst))
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end + 1)
+        return self
+
+    def limit(self, n):
+        self.window = (0, n)
+        return self
+
+    # ── execution ──
+    def execute(self):
+        self.db.calls[(self.table, self.op)] += 1
+        with self.db.lock:
+            return getattr(self, f"_{self.op}")()
+
+    def _matching(self):
+        rows = self.db.tables.setdefault(self.table, [])
+        return [r for r in rows if all(f(r) for f in self.filters)]
+
+    def _select(self):
+        rows = self._matching()
+        for col, desc, nullsfirst in reversed(self.orders):
+            present = sorted((r for r in rows if r.get(col) is not None), key=lambda r: r[col], reverse=desc)
+            nulls = [r for r in rows if r.get(col) is None]
+            rows = nulls + present if nullsfirst else present + nulls
+        total = len(rows)
+        if self.window:
+            rows = rows[self.window[0]:self.window[1]]
+        if self.columns:
+            rows = [{c: r.get(c) for c in self.columns} for r in rows]
+        else:
+            rows = [dict(r) for r in rows]
+        return Response(rows, total if self.count else None)
+
+    def _insert(self):
+        rows = self.payload if isinstance(self.payload, list) else [self.payload]
+        out = [self.db.insert_row(self.table, dict(r)) for r in rows]
+        return Response([dict(r) for r in out])
+
+    def _update(self):
+        rows = self._matching()
+        for r in rows:
+            r.update(self.payload)
+        return Response([dict(r) for r in rows])
+
+    def _upsert(self):
+        rows = self.payload if isinstance(self.payload, list) else [self.payload]
+        by_id = {r["id"]: r for r in self.db.tables.setdefault(self.table, [])}
+        out = []
+        for row in rows:
+            if row.get("id") in by_id:
+                by_id[row["id"]].update(row)
+                out.append(dict(by_id[row["id"]]))
+            else:
+                out.append(dict(self.db.insert_row(self.table, dict(row))))
+        return Response(out)
+
+    def _delete(self):
+        doomed = self._matching()
+        ids = {id(r) for r in doomed}
+        self.db.tables[self.table] = [r for r in self.db.tables.get(self.table, []) if id(r) not in ids]
+        return Response([dict(r) for r in doomed])
+
+
+class Rpc:
+    def __init__(self, db, fn, params):
+        self.db, self.fn, self.params = db, fn, params
+
+    def execute(self):
+        self.db.calls[(f"rpc:{self.fn}", "rpc")] += 1
+        with self.db.lock:
+            return Response(getattr(self.db, f"rpc_{self.fn}")(**self.params))
+
+
+class FakeSupabase:
+    CHILD_TABLES = ["pac_agenda_items", "pac_attendance", "pac_minutes", "pac_action_items", "pac_documents"]
+
+    def __init__(self):
+        self.tables = {}
+        self.calls = Counter()
+        self.lock = threading.RLock()
+        self._ids = itertools.count(1)
+
+    def table(self, name):
+        return Query(self, name)
+
+    from_ = table
+
+    def rpc(self, fn, params=None):
+        return Rpc(self, fn, params or {})
+
+    def insert_row(self, table, row):
+        row.setdefault("id", next(self._ids))
+        row.setdefault("created_at", datetime.now().isoformat())
+        if table == "pac_agenda_items" and row.get("order_no") is None:
+            # migrations/002_agenda_order_no.sql
+            row["order_no"] = 1 + max((r.get("order_no") or 0 for r in self.tables.get(table, [])
+                                       if r.get("meeting_id") == row.get("meeting_id")), default=0)
+        self.tables.setdefault(table, []).append(row)
+        return row
+
+    def query_count(self):
+        return sum(self.calls.values())
+
+    def reset_calls(self):
+        self.calls.clear()
+
+    # migrations/001_pac_delete_meeting.sql
+    def rpc_pac_delete_meeting(self, p_meeting_id):
+        for table in self.CHILD_TABLES:
+            self.tables[table] = [r for r in self.tables.get(table, []) if r.get("meeting_id") != p_meeting_id]
+        self.tables["pac_meetings"] = [r for r in self.tables.get("pac_meetings", []) if r["id"] != p_meeting_id]
+        return None
+
+    # migrations/006_reorder_agenda.sql
+    def rpc_pac_reorder_agenda(self, p_meeting_id, p_ids):
+        position = {aid: i + 1 for i, aid in enumerate(p_ids)}
+        out = []
+        for r in self.tables.get("pac_agenda_items", []):
+            if r.get("meeting_id") == p_meeting_id and r["id"] in position:
+                r["order_no"] = position[r["id"]]
+                out.append(dict(r))
+        return out
+
+    # migrations/005_action_counts.sql
+    def rpc_pac_action_counts(self):
+        counts = Counter()
+        for r in self.tables.get("pac_action_items", []):
+            status = r.get("status") or "Pending"
+            counts["status", status] += 1
+            counts["person", (r.get("responsible_person") or "").strip() or "—"] += 1
+            if status != "Complete" and r.get("due_date"):
+                counts["due", str(r["due_date"])[:10]] += 1
+        return [{"kind": kind, "key": key, "n": n} for (kind, key), n in counts.items()]
+
+    # migrations/004_full_text_search.sql, approximated by word matching.
+    def rpc_pac_search(self, p_query, p_limit=20):
+        words = [w.lower() for w in re.findall(r"\w+", p_query)]
+        meetings = {m["id"]: m for m in self.tables.get("pac_meetings", [])}
+        sources = [("minutes", "pac_minutes", ("content",)),
+                   ("agenda", "pac_agenda_items", ("item_title", "item_description")),
+                   ("action", "pac_action_items", ("action", "responsible_person"))]
+        hits = []
+        for kind, table, cols in sources:
+            for r in self.tables.get(table, []):
+                text = " ".join(str(r.get(c) or "") for c in cols)
+                lower = text.lower()
+                if words and all(w in lower for w in words):
+                    m = meetings.get(r.get("meeting_id"), {})
+                    hits.append({"kind": kind, "item_id": str(r["id"]), "meeting_id": r.get("meeting_id"),
+                                 "meeting_date": m.get("meeting_date"), "meeting_type": m.get("meeting_type"),
+                                 "meeting_status": m.get("status"), "rank": sum(lower.count(w) for w in words),
+                                 "snippet": text[:200]})
+        hits.sort(key=lambda h: -h["rank"])
+        return hits[:p_limit]
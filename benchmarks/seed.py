@@ -0,0 +1,54 @@
+"""Synthetic PAC data for the benchmarks, at a configurable scale."""
+import random
+from datetime import date, timedelta
+
+from fake_supabase import FakeSupabase
+
+WORDS = ("leave policy workload review staffing timetable budget wellbeing induction relief "
+         "consultation allocation roster training safety classroom support enrolment planning").split()
+PEOPLE = [f"{first} {last}" for first in ("Alex", "Sam", "Jo", "Chris", "Pat", "Robin", "Kim", "Lee")
+          for last in ("Nguyen", "Smith", "Brown", "Taylor", "Wilson")]
+
+
+def _sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def seed(meetings=500, actions=20000, agenda_per_meeting=5, attendance_per_meeting=12, minutes_words=600, rng_seed=0):
+    """A ``FakeSupabase`` holding ``meetings`` meetings (mostly finalised, the
+    most recent ones active) with agenda items, attendance, minutes and
+    documents for each, and ``actions`` action items spread across them."""
+    rng = random.Random(rng_seed)
+    db = FakeSupabase()
+    today = date.today()
+    for i in range(meetings):
+        when = today - timedelta(days=14 * (meetings - i - 8))
+        status = "finalised" if when < today - timedelta(days=30) else rng.choice(["upcoming", "open", "draft"])
+        m = db.insert_row("pac_meetings", {
+            "meeting_date": str(when), "start_time": "09:30:00", "location": "LBU Meeting Room",
+            "chair": rng.choice(PEOPLE), "meeting_type": rng.choice(["Ordinary", "Ordinary", "Special"]),
+            "notice_text": "", "status": status,
+        })
+        for _ in range(agenda_per_meeting):
+            db.insert_row("pac_agenda_items", {
+                "meeting_id": m["id"], "submitted_by": rng.choice(PEOPLE), "item_title": _sentence(rng, 4),
+                "item_description": _sentence(rng, 20), "item_type": rng.choice(["Information", "Discussion", "Decision"]),
+            })
+        for person in rng.sample(PEOPLE, attendance_per_meeting):
+            attended = rng.random() > 0.15
+            db.insert_row("pac_attendance", {"meeting_id": m["id"], "staff_name": person, "role": "Teacher",
+                                             "attended": attended, "apology": not attended})
+        if status in ("draft", "finalised"):
+            db.insert_row("pac_minutes", {"meeting_id": m["id"], "content": _sentence(rng, minutes_words), "status": status})
+        db.insert_row("pac_documents", {"meeting_id": m["id"], "document_name": "Policy", "document_url": "https://example.org",
+                                        "description": ""})
+    meeting_ids = [m["id"] for m in db.tables["pac_meetings"]]
+    for _ in range(actions):
+        mid = rng.choice(meeting_ids)
+        db.insert_row("pac_action_items", {
+            "meeting_id": mid, "action": _sentence(rng, 8), "responsible_person": rng.choice(PEOPLE),
+            "due_date": str(today + timedelta(days=rng.randint(-365, 90))) if rng.random() > 0.05 else None,
+            "status": rng.choice(["Pending", "In Progress", "Complete", "Complete"]),
+        })
+    db.reset_calls()
+    return db
@@ -0,0 +1,30 @@
+-- Delete a meeting and all of its child rows in one transaction, so the app
+-- can remove a meeting with a single supabase.rpc("pac_delete_meeting") call.
+-- The parameter takes the type of pac_meetings.id, whatever it is.
+do $$
+declare
+  id_type text;
+begin
+  select format_type(a.atttypid, a.atttypmod) into id_type
+  from pg_attribute a
+  where a.attrelid = 'public.pac_meetings'::regclass and a.attname = 'id';
+
+  execute format($fn$
+    create or replace function public.pac_delete_meeting(p_meeting_id %s)
+    returns void
+    language plpgsql
+    as $body$
+    begin
+      delete from public.pac_agenda_items where meeting_id = p_meeting_id;
+      delete from public.pac_attendance where meeting_id = p_meeting_id;
+      delete from public.pac_minutes where meeting_id = p_meeting_id;
+      delete from public.pac_action_items where meeting_id = p_meeting_id;
+      delete from public.pac_documents where meeting_id = p_meeting_id;
+      delete from public.pac_meetings where id = p_meeting_id;
+    end
+    $body$
+  $fn$, id_type);
+end
+$$;
+
+notify pgrst, 'reload schema';
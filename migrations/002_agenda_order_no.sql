@@ -0,0 +1,23 @@
+-- Number agenda items in the database. An insert that leaves order_no null
+-- gets the next number for its meeting; the per-meeting advisory lock makes
+-- concurrent submissions queue instead of taking the same number. Inserts
+-- and upserts that supply order_no (e.g. a saved reorder) keep their value.
+create or replace function public.pac_agenda_items_set_order_no()
+returns trigger
+language plpgsql
+as $$
+begin
+  if new.order_no is null then
+    perform pg_advisory_xact_lock(hashtext('pac_agenda_items:' || new.meeting_id::text));
+    select coalesce(max(order_no), 0) + 1 into new.order_no
+    from public.pac_agenda_items
+    where meeting_id = new.meeting_id;
+  end if;
+  return new;
+end
+$$;
+
+drop trigger if exists pac_agenda_items_order_no on public.pac_agenda_items;
+create trigger pac_agenda_items_order_no
+  before insert on public.pac_agenda_items
+  for each row execute function public.pac_agenda_items_set_order_no();
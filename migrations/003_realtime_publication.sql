@@ -0,0 +1,15 @@
+-- Publish row changes on the PAC tables to Supabase Realtime, which the app's
+-- change feed (pac/realtime.py) subscribes to when PAC_REALTIME is enabled.
+do $$
+declare
+  t text;
+begin
+  foreach t in array array['pac_meetings', 'pac_agenda_items', 'pac_attendance',
+                           'pac_minutes', 'pac_action_items', 'pac_documents'] loop
+    if not exists (select 1 from pg_publication_tables
+                   where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = t) then
+      execute format('alter publication supabase_realtime add table public.%I', t);
+    end if;
+  end loop;
+end
+$$;
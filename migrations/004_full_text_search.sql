@@ -0,0 +1,66 @@
+-- Full-text search over minutes, agenda items and action items.
+-- Each table gets a GIN index on a tsvector expression, and pac_search(query,
+-- limit) returns the best-ranked hits with a highlighted snippet and the
+-- meeting they belong to, so the app never has to load minutes documents to
+-- search them. The indexes are on expressions rather than stored columns so
+-- that select * reads (and realtime events) do not start carrying tsvectors;
+-- pac_search repeats the expressions exactly so the planner can use them.
+create index if not exists pac_minutes_search_idx on public.pac_minutes
+  using gin (to_tsvector('english', coalesce(content, '')));
+create index if not exists pac_agenda_items_search_idx on public.pac_agenda_items
+  using gin (to_tsvector('english', coalesce(item_title, '') || ' ' || coalesce(item_description, '')));
+create index if not exists pac_action_items_search_idx on public.pac_action_items
+  using gin (to_tsvector('english', coalesce(action, '') || ' ' || coalesce(responsible_person, '')));
+
+-- meeting_id is returned with the type of pac_meetings.id, as in 001.
+do $$
+declare
+  id_type text;
+begin
+  select format_type(a.atttypid, a.atttypmod) into id_type
+  from pg_attribute a
+  where a.attrelid = 'public.pac_meetings'::regclass and a.attname = 'id';
+
+  execute 'drop function if exists public.pac_search(text, integer)';
+  execute format($fn$
+    create function public.pac_search(p_query text, p_limit integer default 20)
+    returns table (kind text, item_id text, meeting_id %s, meeting_date date,
+                   meeting_type text, meeting_status text, rank real, snippet text)
+    language sql stable
+    as $body$
+      with q as (select websearch_to_tsquery('english', p_query) as tsq),
+      hits as (
+        select 'minutes'::text as kind, x.id::text as item_id, x.meeting_id,
+               ts_rank(to_tsvector('english', coalesce(x.content, '')), q.tsq) as rank,
+               x.content as body
+        from public.pac_minutes x, q
+        where to_tsvector('english', coalesce(x.content, '')) @@ q.tsq
+        union all
+        select 'agenda', x.id::text, x.meeting_id,
+               ts_rank(to_tsvector('english', coalesce(x.item_title, '') || ' ' || coalesce(x.item_description, '')), q.tsq),
+               concat_ws(' — ', x.item_title, nullif(x.item_description, ''))
+        from public.pac_agenda_items x, q
+        where to_tsvector('english', coalesce(x.item_title, '') || ' ' || coalesce(x.item_description, '')) @@ q.tsq
+        union all
+        select 'action', x.id::text, x.meeting_id,
+               ts_rank(to_tsvector('english', coalesce(x.action, '') || ' ' || coalesce(x.responsible_person, '')), q.tsq),
+               concat_ws(' — ', x.action, x.responsible_person)
+        from public.pac_action_items x, q
+        where to_tsvector('english', coalesce(x.action, '') || ' ' || coalesce(x.responsible_person, '')) @@ q.tsq
+      ),
+      top as (select * from hits order by rank desc limit greatest(1, least(p_limit, 100)))
+      -- Snippets are built for the returned hits only: ts_headline re-parses
+      -- the document, which is the expensive part of a search.
+      select t.kind, t.item_id, t.meeting_id, m.meeting_date::date, m.meeting_type, m.status,
+             t.rank, ts_headline('english', t.body, q.tsq,
+                                 'StartSel=**, StopSel=**, MaxWords=30, MinWords=12, MaxFragments=2')
+      from top t
+      cross join q
+      join public.pac_meetings m on m.id = t.meeting_id
+      order by t.rank desc, m.meeting_date desc
+    $body$
+  $fn$, id_type);
+end
+$$;
+
+notify pgrst, 'reload schema';
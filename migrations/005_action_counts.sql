@@ -0,0 +1,23 @@
+-- Action register counts for the app's ActionIndex (pac/actions.py), grouped
+-- in the database so building them reads a few hundred rows, not every action:
+-- actions by status, by responsible person, and pending actions by due date
+-- (the overdue count for any cut-off is a sum over the earlier due dates).
+-- Blank values are grouped as the app shows them: status 'Pending', person '—'.
+create or replace function public.pac_action_counts()
+returns table (kind text, key text, n bigint)
+language sql stable
+as $$
+  with a as (
+    select coalesce(nullif(status, ''), 'Pending') as status,
+           coalesce(nullif(btrim(responsible_person), ''), '—') as person,
+           nullif(left(due_date::text, 10), '') as due
+    from public.pac_action_items
+  )
+  select 'status', status, count(*) from a group by status
+  union all
+  select 'person', person, count(*) from a group by person
+  union all
+  select 'due', due, count(*) from a where status <> 'Complete' and due is not null group by due
+$$;
+
+notify pgrst, 'reload schema';
@@ -0,0 +1,35 @@
+-- Save a new agenda order in one call. p_ids lists a meeting's agenda item ids
+-- in their new order, and each item gets its position (from 1) as order_no;
+-- the updated rows are returned. This is an UPDATE rather than an upsert: an
+-- upsert's proposed row is checked against NOT NULL columns and row-level
+-- security INSERT policies before the conflict is resolved, so a row holding
+-- only the id and order_no is rejected. The parameters take the types of
+-- pac_meetings.id and pac_agenda_items.id, as in 001.
+do $$
+declare
+  meeting_id_type text;
+  item_id_type text;
+begin
+  select format_type(a.atttypid, a.atttypmod) into meeting_id_type
+  from pg_attribute a
+  where a.attrelid = 'public.pac_meetings'::regclass and a.attname = 'id';
+  select format_type(a.atttypid, a.atttypmod) into item_id_type
+  from pg_attribute a
+  where a.attrelid = 'public.pac_agenda_items'::regclass and a.attname = 'id';
+
+  execute format($fn$
+    create or replace function public.pac_reorder_agenda(p_meeting_id %s, p_ids %s[])
+    returns setof public.pac_agenda_items
+    language sql
+    as $body$
+      update public.pac_agenda_items i
+      set order_no = o.position
+      from unnest(p_ids) with ordinality as o(id, position)
+      where i.id = o.id and i.meeting_id = p_meeting_id
+      returning i.*
+    $body$
+  $fn$, meeting_id_type, item_id_type);
+end
+$$;
+
+notify pgrst, 'reload schema';
@@ -0,0 +1 @@
+"""Support modules for the PAC Streamlit app (pac_app.py)."""
@@ -0,0 +1,107 @@
+"""Maintained aggregates over the action register.
+
+``ActionIndex`` holds counts of action items by status and by responsible
+person, plus the number of pending actions due on each date in sorted order.
+It is built from one grouped query (the ``pac_action_counts`` RPC, see
+migrations/005_action_counts.sql), which returns a row per status, person and
+due date rather than a row per action. Action writes and meeting deletes seen
+by the read cache (``TTLCache.subscribe``) mark it stale, and so does age:
+changes made elsewhere (another server, the Supabase dashboard) reach this
+process only through the realtime feed, if at all. The metric widgets read
+the counters, and the next read after a change rebuilds them.
+
+Due dates are ISO ``YYYY-MM-DD`` strings, which sort like the dates they
+name: an action is overdue when its due date is below today's ISO date, and
+the overdue count is one bisect against that cut-off.
+"""
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from datetime import date
+from itertools import accumulate
+
+from pac.dates import iso
+
+COMPLETE = "Complete"
+
+
+def cutoff(today=None):
+    """The overdue cut-off: pending actions due before this are overdue."""
+    return (today or date.today()).isoformat()
+
+
+def is_overdue(action, today_iso):
+    due = iso(action.get("due_date"))
+    return action.get("status") != COMPLETE and due is not None and due < today_iso
+
+
+class ActionIndex:
+    def __init__(self, load, max_age=None):
+        # load() returns pac_action_counts rows: {"kind", "key", "n"}. The index
+        # is rebuilt when it is more than max_age seconds old (None: never).
+        self.load = load
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._stale = True
+        self._generation = 0
+        self._built = None
+        self._reset()
+
+    def _reset(self):
+        self.by_status = Counter()
+        self.by_person = Counter()
+        self._due_dates = []
+        self._due_before = [0]
+
+    def listener(self, table, row, deleted):
+        """``TTLCache.subscribe`` callback."""
+        if table in ("pac_action_items", None) or (table == "pac_meetings" and deleted):
+            # A meeting delete removes its actions in the database.
+            with self._lock:
+                self._stale = True
+                self._generation += 1
+
+    def _expired(self):
+        return self._stale or (self.max_age is not None and time.monotonic() - self._built > self.max_age)
+
+    def _ensure(self):
+        # Sessions that find the index stale together wait for one rebuild.
+        with self._load_lock:
+            with self._lock:
+                if not self._expired():
+                    return
+                generation = self._generation
+            built = time.monotonic()
+            rows = self.load()
+            with self._lock:
+                self._reset()
+                due = Counter()
+                for row in rows:
+                    counter = {"status": self.by_status, "person": self.by_person, "due": due}.get(row["kind"])
+                    if counter is not None:
+                        counter[row["key"]] += int(row["n"])
+                self._due_dates = sorted(due)
+                # _due_before[i]: pending actions due before _due_dates[i].
+                self._due_before = [0, *accumulate(due[d] for d in self._due_dates)]
+                self._built = built
+                # A write that landed during the load leaves the index stale, so
+                # the next read rebuilds it rather than serving a missed change.
+                self._stale = generation != self._generation
+
+    def summary(self, today_iso=None):
+        """Counts for the register: total, pending, complete and overdue,
+        plus the per-status and per-person counters."""
+        self._ensure()
+        with self._lock:
+            total = sum(self.by_status.values())
+            complete = self.by_status.get(COMPLETE, 0)
+            return {
+                "total": total,
+                "pending": total - complete,
+                "complete": complete,
+                "overdue": self._due_before[bisect_left(self._due_dates, today_iso or cutoff())],
+                "by_status": dict(self.by_status),
+                "by_person": dict(self.by_person),
+            }
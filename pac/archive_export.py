@@ -0,0 +1,141 @@
+"""Bulk export of finalised meetings as a ZIP, for audit.
+
+For every finalised meeting in a date range the archive holds a folder with
+the minutes (``minutes.txt``), the attendance register (``attendance.csv``)
+and the action register (``actions.csv``), plus an ``index.csv`` of all the
+meetings included. Meetings are read in pages of ``batch`` and their child rows
+in one paged query per table per batch; each entry is written to the ZIP as
+soon as its rows arrive. Memory therefore depends on the batch size, not on how
+many meetings are exported (apart from the ZIP's central directory, a few
+hundred bytes per file). Admins can build the ZIP in the Archive tab; for large
+ranges, use the command line::
+
+    SUPABASE_URL=... SUPABASE_KEY=... python -m pac.archive_export --since 2025-01-01 --until 2025-12-31 -o pac_2025.zip
+"""
+import argparse
+import csv
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+import zipfile
+
+from pac.models import records
+
+MEETING_COLUMNS = "id, meeting_date, start_time, location, chair, meeting_type, status"
+CHILD_ORDER = {"pac_minutes": "id", "pac_attendance": "staff_name", "pac_action_items": "created_at"}
+# Supabase returns at most this many rows per request (PostgREST max-rows).
+PAGE = 1000
+INDEX_HEADER = ["meeting_date", "meeting_type", "chair", "location", "folder", "minutes", "present", "apologies",
+                "absent", "actions", "actions_complete"]
+
+
+def _paged(query, batch):
+    """All rows of ``query()`` (a fresh request builder per call), ``batch`` at a time."""
+    start = 0
+    while True:
+        rows = query().range(start, start + batch - 1).execute().data
+        yield from rows
+        if len(rows) < batch:
+            return
+        start += batch
+
+
+def _meeting_pages(client, since, until, batch):
+    def query():
+        q = client.table("pac_meetings").select(MEETING_COLUMNS).eq("status", "finalised")
+        if since:
+            q = q.gte("meeting_date", str(since))
+        if until:
+            q = q.lte("meeting_date", str(until))
+        return q.order("meeting_date").order("id")
+    page = []
+    for row in _paged(query, batch):
+        page.append(row)
+        if len(page) == batch:
+            yield records("pac_meetings", page)
+            page = []
+    if page:
+        yield records("pac_meetings", page)
+
+
+def _children(client, table, meeting_ids, batch):
+    grouped = {mid: [] for mid in meeting_ids}
+    query = lambda: client.table(table).select("*").in_("meeting_id", meeting_ids).order(CHILD_ORDER[table]).order("id")
+    for row in records(table, list(_paged(query, batch))):
+        grouped.setdefault(row.meeting_id, []).append(row)
+    return grouped
+
+
+def _folder(m):
+    return re.sub(r"[^\w.-]+", "_", f"{m.meeting_date or 'undated'}_{m.meeting_type}_{m.id}")
+
+
+def _write_csv(zf, name, header, rows):
+    with zf.open(name, "w") as raw, io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        w.writerows(rows)
+
+
+def export_archive(client, out, since=None, until=None, batch=100, progress=None):
+    """Write the ZIP for finalised meetings dated ``since``..``until`` (ISO
+    dates, inclusive, either open) to the binary file ``out``; returns the
+    number of meetings written. ``progress(n)`` is called after each batch."""
+    batch = min(batch, PAGE)
+    n = 0
+    with tempfile.TemporaryFile("w+", encoding="utf-8", newline="") as index, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        index_csv = csv.writer(index)
+        index_csv.writerow(INDEX_HEADER)
+        for meetings in _meeting_pages(client, since, until, batch):
+            ids = [m.id for m in meetings]
+            minutes = _children(client, "pac_minutes", ids, PAGE)
+            attendance = _children(client, "pac_attendance", ids, PAGE)
+            actions = _children(client, "pac_action_items", ids, PAGE)
+            for m in meetings:
+                folder = _folder(m)
+                mins = minutes[m.id][0] if minutes[m.id] else None
+                if mins and mins.content:
+                    zf.writestr(f"{folder}/minutes.txt", mins.content)
+                att = attendance[m.id]
+                _write_csv(zf, f"{folder}/attendance.csv", ["staff_name", "role", "status"],
+                           ([a.staff_name, a.role, "Present" if a.attended else "Apology" if a.apology else "Absent"] for a in att))
+                acts = actions[m.id]
+                _write_csv(zf, f"{folder}/actions.csv", ["action", "responsible_person", "status", "due_date", "created_at"],
+                           ([a.action, a.responsible_person, a.status, a.due_date or "", a.created_at or ""] for a in acts))
+                index_csv.writerow([m.meeting_date, m.meeting_type, m.chair, m.location, folder, "yes" if mins else "no",
+                                    sum(a.attended for a in att), sum(a.apology for a in att), sum(a.absent for a in att),
+                                    len(acts), sum(a.complete for a in acts)])
+                n += 1
+            if progress:
+                progress(n)
+        index.seek(0)
+        with zf.open("index.csv", "w") as raw, io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+            shutil.copyfileobj(index, f)
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--since", help="first meeting date, YYYY-MM-DD (default: the earliest)")
+    parser.add_argument("--until", help="last meeting date, YYYY-MM-DD (default: the latest)")
+    parser.add_argument("-o", "--output", default="pac_archive.zip", help="ZIP file to write (default: %(default)s)")
+    parser.add_argument("--batch", type=int, default=100, help="meetings per query (default: %(default)s)")
+    parser.add_argument("--url", default=os.environ.get("SUPABASE_URL"), help="Supabase URL (default: $SUPABASE_URL)")
+    parser.add_argument("--key", default=os.environ.get("SUPABASE_KEY"), help="Supabase key (default: $SUPABASE_KEY)")
+    args = parser.parse_args(argv)
+    if not args.url or not args.key:
+        parser.error("no Supabase project: pass --url/--key or set SUPABASE_URL and SUPABASE_KEY")
+    from supabase import create_client
+    client = create_client(args.url, args.key)
+    with open(args.output, "wb") as out:
+        n = export_archive(client, out, args.since, args.until, args.batch,
+                           progress=lambda n: print(f"\r{n} meetings", end="", file=sys.stderr))
+    print(f"\nWrote {n} finalised meetings to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""Process-wide read model over Supabase: a TTL + LRU cache shared by sessions.
+
+Keys are ``(table, scope)`` tuples. ``scope`` is either a meeting id (rows of
+``table`` belonging to that meeting), a row id (a single row), or a tuple
+describing some other query over ``table`` (a list, a page, ...).
+
+Writes keep the cache current without re-reading: ``patch`` applies the row a
+write returned to every cached entry of its table. Row-list entries cached
+with a ``match`` predicate (and optional ``order``) are patched in place;
+entries that cannot be patched exactly are dropped.
+
+Each table has a version, bumped by every patch or invalidation. A load that
+overlaps a write to its table is returned to its caller but not cached, so a
+slow read can never overwrite a newer write. Concurrent misses on the same key
+share one load (``get_or_load``). Memory is bounded by ``maxsize`` entries and
+``max_rows`` cached rows in total.
+
+With ``records`` (e.g. ``pac.models.record``), patched rows are converted to
+the same record type the loaders cache, so cached values never mix raw rows
+and records.
+
+Derived views that are maintained from the same writes (e.g. the action
+register aggregates) ``subscribe`` to be told of every patch and invalidation.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+MISSING = object()
+
+
+class Entry:
+    __slots__ = ("expires", "value", "match", "order", "desc", "size", "rows")
+
+    def __init__(self, expires, value, match, order, desc, size=None):
+        self.expires = expires
+        self.value = value
+        self.match = match
+        self.order = order
+        self.desc = desc
+        self.size = size
+        self.rows = _row_count(value)
+
+
+class Flight:
+    __slots__ = ("version", "done", "value", "error")
+
+    def __init__(self, version):
+        self.version = version
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class TTLCache:
+    def __init__(self, maxsize=2048, ttl=60.0, max_rows=200_000, records=None):
+        # ttl=None keeps entries until they are evicted or patched away, for
+        # when something else (e.g. a realtime change feed) keeps them current.
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.records = records
+        self._data = OrderedDict()
+        self._rows = 0
+        self._versions = {}
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._stats = {"hits": 0, "misses": 0, "loads": 0, "coalesced": 0, "stale_loads": 0, "evictions": 0}
+
+    def get(self, key, default=MISSING):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry.expires is not None and entry.expires < time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return default
+            self._stats["hits"] += 1
+            self._data.move_to_end(key)
+            return entry.value
+
+    def subscribe(self, listener):
+        """Call ``listener(table, row, deleted)`` after every ``patch``, and
+        ``listener(table, None, False)`` after an invalidation (``table`` is
+        None when everything was cleared)."""
+        self._listeners.append(listener)
+        return listener
+
+    def version(self, table):
+        return self._versions.get(table, 0)
+
+    def set(self, key, value, match=None, order=None, desc=False, version=None, size=None):
+        """Cache ``value``. For a row list (or a ``(rows, total)`` page),
+        ``match(row)`` says whether a row belongs in it and ``order(row)`` is
+        its sort key, which lets ``patch`` keep it current; ``size`` is a
+        page's length limit. If ``version`` is given and the table has been
+        written since, nothing is stored."""
+        with self._lock:
+            if version is not None and version != self.version(key[0]):
+                self._stats["stale_loads"] += 1
+                return
+            self._store(key, value, match, order, desc, size)
+
+    def get_or_load(self, key, load, match=None, order=None, desc=False, store=True, size=None):
+        """Return the cached value for ``key``, calling ``load()`` on a miss.
+
+        Concurrent misses on the same key wait for a single ``load()``. With
+        ``store=False`` the loaded value is shared with waiters but not cached
+        (for loads that store entries of their own). Such a load must read
+        ``version`` itself before it queries and ``set`` under that: a waiter
+        joining later may already have seen a newer version.
+        """
+        value = self.get(key)
+        if value is not MISSING:
+            return value
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Flight(self.version(key[0]))
+                self._stats["loads"] += 1
+            else:
+                self._stats["coalesced"] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            flight.value = load()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                if store and flight.error is None:
+                    if flight.version == self.version(key[0]):
+                        self._store(key, flight.value, match, order, desc, size)
+                    else:
+                        self._stats["stale_loads"] += 1
+            flight.done.set()
+        return flight.value
+
+    def invalidate(self, table, meeting_id=None):
+        """Drop cached reads of ``table``.
+
+        With a ``meeting_id`` only that meeting's rows are dropped, together
+        with every non-meeting query (lists, pages) over the table, since the
+        write may have changed those too.
+        """
+        with self._lock:
+            self._bump(table)
+            for key in [k for k in self._data if k[0] == table]:
+                if meeting_id is None or key[1] == meeting_id or isinstance(key[1], tuple):
+                    self._drop(key)
+        self._notify(table, None, False)
+
+    def patch(self, table, row, deleted=False):
+        """Apply a written (or, with ``deleted``, removed) ``row`` of ``table``."""
+        if self.records is not None and not deleted:
+            row = self.records(table, row)
+        with self._lock:
+            self._bump(table)
+            for key in [k for k in self._data if k[0] == table]:
+                entry = self._data[key]
+                if not isinstance(entry.value, (list, tuple)):
+                    if key[1] == row.get("id"):
+                        if deleted:
+                            self._drop(key)
+                        elif isinstance(entry.value, dict):
+                            entry.value = {**entry.value, **row}
+                        else:
+                            entry.value = row
+                elif entry.match is not None:
+                    value = _patch_rows(entry, row, deleted)
+                    if value is MISSING:
+                        self._drop(key)
+                    else:
+                        self._rows += _row_count(value) - entry.rows
+                        entry.value, entry.rows = value, _row_count(value)
+                elif isinstance(key[1], tuple):
+                    self._drop(key)
+            self._evict()
+        self._notify(table, row, deleted)
+
+    def clear(self):
+        with self._lock:
+            for table in {k[0] for k in self._data}:
+                self._bump(table)
+            self._data.clear()
+            self._rows = 0
+        self._notify(None, None, False)
+
+    def stats(self):
+        with self._lock:
+            return {**self._stats, "entries": len(self._data), "rows": self._rows,
+                    "in_flight": len(self._flights), "versions": dict(self._versions)}
+
+    def __len__(self):
+        return len(self._data)
+
+    def _notify(self, table, row, deleted):
+        for listener in self._listeners:
+            listener(table, row, deleted)
+
+    # The helpers below expect self._lock to be held.
+
+    def _store(self, key, value, match, order, desc, size=None):
+        if key in self._data:
+            self._drop(key)
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        entry = self._data[key] = Entry(expires, value, match, order, desc, size)
+        self._rows += entry.rows
+        self._evict()
+
+    def _drop(self, key):
+        self._rows -= self._data.pop(key).rows
+
+    def _bump(self, table):
+        self._versions[table] = self._versions.get(table, 0) + 1
+
+    def _evict(self):
+        while self._data and (len(self._data) > self.maxsize or self._rows > self.max_rows):
+            self._drop(next(iter(self._data)))
+            self._stats["evictions"] += 1
+
+
+def _row_count(value):
+    if isinstance(value, tuple):
+        value = value[0]
+    return len(value) if isinstance(value, list) else 1
+
+
+def _patch_rows(entry, row, deleted):
+    paged = isinstance(entry.value, tuple)
+    rows, total = entry.value if paged else (entry.value, None)
+    if paged and total != len(rows):
+        # Only one page of the result is cached: the row may be on another
+        # page or shift the page boundaries.
+        return MISSING
+    was_in = any(r.get("id") == row.get("id") for r in rows)
+    now_in = not deleted and entry.match(row)
+    if not was_in and not now_in:
+        return entry.value
+    if paged and now_in and not was_in and (entry.size is None or len(rows) >= entry.size):
+        # A full page (or one of unknown size) would overflow onto the next.
+        return MISSING
+    rows = [r for r in rows if r.get("id") != row.get("id")]
+    if now_in:
+        rows.append(row)
+        if entry.order is not None:
+            rows.sort(key=entry.order, reverse=entry.desc)
+    return (rows, len(rows)) if paged else rows
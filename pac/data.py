@@ -0,0 +1,223 @@
+"""Data layer: cached reads and cache-patching writes against Supabase.
+
+Every read goes through the shared ``TTLCache`` (see pac.cache), keyed by table
+so writes can patch or drop what they touch. Reads return pac.models records.
+Views load only what they render: a page of meetings, then the child rows of
+the meetings on screen, in one bulk select per table.
+"""
+from datetime import date
+
+import streamlit as st
+
+from pac.cache import MISSING
+from pac.models import records
+from pac.services import init_cache, init_supabase
+
+CHILD_TABLES = {
+    "pac_agenda_items": "order_no",
+    "pac_attendance": "staff_name",
+    "pac_minutes": None,
+    "pac_action_items": "created_at",
+    "pac_documents": "created_at",
+}
+MEETING_COLUMNS = "id, meeting_date, start_time, location, chair, meeting_type, notice_text, status"
+MEETING_INDEX_COLUMNS = "id, meeting_date, meeting_type, chair, location, status"
+# Status filters for db_meeting_page: a PostgREST or-filter, and the statuses
+# it selects for rows patched into cached pages. A meeting with no status shows
+# as upcoming (pac.models), so it is listed as one; an unexpected status is
+# still an active meeting.
+ACTIVE = ("status.is.null,status.neq.finalised", lambda s: s != "finalised")
+UPCOMING = ("status.is.null,status.eq.upcoming,status.eq.open", lambda s: s in ("upcoming", "open"))
+FINALISED = ("status.eq.finalised", lambda s: s == "finalised")
+
+MEETING_PAGE_SIZE = int(st.secrets.get("PAC_MEETING_PAGE_SIZE", 20))
+ARCHIVE_PAGE_SIZE = int(st.secrets.get("PAC_ARCHIVE_PAGE_SIZE", 20))
+ACTION_PAGE_SIZE = int(st.secrets.get("PAC_ACTION_PAGE_SIZE", 100))
+
+
+def cached(key, load, match=None, order=None, desc=False, size=None):
+    return init_cache().get_or_load(key, load, match, order, desc, size=size)
+
+
+def sort_key(col):
+    return lambda r: (r.get(col) is None, r.get(col))
+
+
+def db_meeting_page(status, page, since=None, until=None, columns=MEETING_COLUMNS, size=MEETING_PAGE_SIZE):
+    cache = init_cache()
+    status_filter, status_match = status
+    def load():
+        version = cache.version("pac_meetings")
+        q = init_supabase().table("pac_meetings").select(columns, count="exact").or_(status_filter)
+        if since:
+            q = q.gte("meeting_date", str(since))
+        if until:
+            q = q.lte("meeting_date", str(until))
+        start = page * size
+        r = q.order("meeting_date", desc=True).range(start, start + size - 1).execute()
+        rows = records("pac_meetings", r.data)
+        if columns == MEETING_COLUMNS:
+            # Full rows: opening one of these meetings needs no further query.
+            for m in rows:
+                cache.set(("pac_meetings", m.id), m, version=version)
+        return rows, r.count or 0
+    def match(r):
+        d = str(r.get("meeting_date") or "")
+        return status_match(r.get("status") or "upcoming") and (not since or d >= str(since)) and (not until or d <= str(until))
+    return cached(("pac_meetings", ("page", status_filter, page, str(since), str(until), columns, size)), load,
+                  match, sort_key("meeting_date"), desc=True, size=size)
+
+
+def db_meetings_by_id(meeting_ids):
+    cache = init_cache()
+    found = {mid: cache.get(("pac_meetings", mid)) for mid in set(meeting_ids)}
+    missing = [mid for mid, row in found.items() if row is MISSING]
+    if missing:
+        def load():
+            # Cached by whichever session runs the load, under the version it
+            # started from: sessions that join later may have seen a newer one.
+            version = cache.version("pac_meetings")
+            rows = records("pac_meetings", init_supabase().table("pac_meetings").select(MEETING_COLUMNS).in_("id", missing).execute().data)
+            for row in rows:
+                cache.set(("pac_meetings", row.id), row, version=version)
+            return rows
+        for row in cache.get_or_load(("pac_meetings", ("by_id", tuple(sorted(missing, key=str)))), load, store=False):
+            found[row.id] = row
+    return {mid: row for mid, row in found.items() if row is not MISSING}
+
+
+def db_archive_years():
+    def load():
+        r = init_supabase().table("pac_meetings").select("meeting_date").eq("status", "finalised").order("meeting_date").limit(1).execute().data
+        first = int(str(r[0]["meeting_date"])[:4]) if r else date.today().year
+        return list(range(date.today().year, first - 1, -1))
+    return cached(("pac_meetings", ("archive_years",)), load)
+
+
+def db_archive_index(year, page):
+    since, until = (f"{year}-01-01", f"{year}-12-31") if year else (None, None)
+    return db_meeting_page(FINALISED, page, since, until, MEETING_INDEX_COLUMNS, ARCHIVE_PAGE_SIZE)
+
+
+def db_children(table, meeting_ids):
+    cache = init_cache()
+    grouped = {mid: cache.get((table, mid)) for mid in meeting_ids}
+    missing = [mid for mid, rows in grouped.items() if rows is MISSING]
+    if missing:
+        def load():
+            # As in db_meetings_by_id, the session running the load caches it.
+            version = cache.version(table)
+            q = init_supabase().table(table).select("*").in_("meeting_id", missing)
+            if CHILD_TABLES[table]:
+                q = q.order(CHILD_TABLES[table])
+            rows = records(table, q.execute().data)
+            by_meeting = {mid: [] for mid in missing}
+            for row in rows:
+                by_meeting.setdefault(row.meeting_id, []).append(row)
+            order = sort_key(CHILD_TABLES[table]) if CHILD_TABLES[table] else None
+            for mid in missing:
+                cache.set((table, mid), by_meeting[mid], lambda r, mid=mid: r.get("meeting_id") == mid, order, version=version)
+            return by_meeting
+        grouped.update(cache.get_or_load((table, ("children", tuple(sorted(missing, key=str)))), load, store=False))
+    return grouped
+
+
+def db_action_page(complete, page):
+    def load():
+        q = init_supabase().table("pac_action_items").select("*", count="exact")
+        if complete:
+            q = q.eq("status", "Complete").order("created_at", desc=True)
+        else:
+            q = q.or_("status.is.null,status.neq.Complete").order("due_date", nullsfirst=True)
+        start = page * ACTION_PAGE_SIZE
+        r = q.range(start, start + ACTION_PAGE_SIZE - 1).execute()
+        return records("pac_action_items", r.data), r.count or 0
+    if complete:
+        match, order, desc = (lambda r: r.get("status") == "Complete"), sort_key("created_at"), True
+    else:
+        match, order, desc = (lambda r: r.get("status") != "Complete"), (lambda r: (r.get("due_date") is not None, r.get("due_date") or "")), False
+    return cached(("pac_action_items", ("page", complete, page, ACTION_PAGE_SIZE)), load, match, order, desc, ACTION_PAGE_SIZE)
+
+
+# Ranked hits from the pac_search RPC (migrations/004_full_text_search.sql):
+# Postgres searches its GIN indexes and returns only the top hits with snippets.
+SEARCH_TABLES = ("pac_minutes", "pac_agenda_items", "pac_action_items")
+SEARCH_LIMIT = int(st.secrets.get("PAC_SEARCH_LIMIT", 20))
+
+
+def db_search(query):
+    query = " ".join(query.split())
+    if not query:
+        return []
+    return cached(("pac_search", (query.lower(), SEARCH_LIMIT)),
+                  lambda: init_supabase().rpc("pac_search", {"p_query": query, "p_limit": SEARCH_LIMIT}).execute().data)
+
+
+# Every write goes through these. Supabase returns the written rows, which are
+# patched into the cache, so the rerun after a write renders without re-reading.
+def apply_write(table, rows, deleted=False, meeting_id=None):
+    cache = init_cache()
+    if not rows:
+        # Nothing came back (e.g. hidden by row-level security): fall back to invalidating.
+        cache.invalidate(table, meeting_id)
+    for row in rows:
+        cache.patch(table, row, deleted)
+    return rows
+
+
+def db_insert(table, row):
+    return apply_write(table, init_supabase().table(table).insert(row).execute().data, meeting_id=row.get("meeting_id"))
+
+
+def db_update(table, values, match, meeting_id=None):
+    q = init_supabase().table(table).update(values)
+    for col, val in match.items():
+        q = q.eq(col, val)
+    return apply_write(table, q.execute().data, meeting_id=meeting_id)
+
+
+def db_delete(table, match, meeting_id=None):
+    q = init_supabase().table(table).delete()
+    for col, val in match.items():
+        q = q.eq(col, val)
+    return apply_write(table, q.execute().data, deleted=True, meeting_id=meeting_id)
+
+
+# One round trip, one transaction: see migrations/001_pac_delete_meeting.sql.
+def db_delete_meeting(mid):
+    init_supabase().rpc("pac_delete_meeting", {"p_meeting_id": mid}).execute()
+    cache = init_cache()
+    cache.patch("pac_meetings", {"id": mid}, deleted=True)
+    for table in CHILD_TABLES:
+        cache.invalidate(table, mid)
+
+
+# One UPDATE for every position: see migrations/006_reorder_agenda.sql.
+def db_reorder_agenda(mid, item_ids):
+    rows = init_supabase().rpc("pac_reorder_agenda", {"p_meeting_id": mid, "p_ids": list(item_ids)}).execute().data
+    return apply_write("pac_agenda_items", rows, meeting_id=mid)
+
+
+def db_meeting(mid):
+    return db_meetings_by_id([mid]).get(mid)
+
+
+def db_agenda(mid):
+    return db_children("pac_agenda_items", [mid])[mid]
+
+
+def db_attendance(mid):
+    return db_children("pac_attendance", [mid])[mid]
+
+
+def db_minutes(mid):
+    r = db_children("pac_minutes", [mid])[mid]
+    return r[0] if r else None
+
+
+def db_actions(mid):
+    return db_children("pac_action_items", [mid])[mid]
+
+
+def db_docs(mid):
+    return db_children("pac_documents", [mid])[mid]
@@ -0,0 +1,61 @@
+"""Date parsing and display for rows read from Supabase.
+
+Dates arrive as ISO strings (``2025-03-14`` or a full timestamp). Each
+distinct value is parsed once with ``date.fromisoformat`` and its display
+string built once; both are memoised, so render loops that show the same
+meeting and due dates over and over do a dict lookup per call.
+"""
+from datetime import date
+from functools import lru_cache
+
+MONTHS = ["", "January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+EMPTY = "—"
+
+
+def iso(value):
+    """The ``YYYY-MM-DD`` part of a date, timestamp or ISO string, or None."""
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()[:10]
+    return str(value)[:10]
+
+
+@lru_cache(maxsize=8192)
+def _parse(text):
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def parse_date(value):
+    """``value`` as a ``date``, or None when it is empty or not an ISO date."""
+    if isinstance(value, date):
+        return value
+    text = iso(value)
+    return _parse(text) if text else None
+
+
+@lru_cache(maxsize=8192)
+def _format(text):
+    d = _parse(text)
+    # "%-d" is not portable (Windows), and building the string by hand is faster.
+    return f"{d.day} {MONTHS[d.month]} {d.year}" if d else text
+
+
+def fmt_date(value):
+    """``14 March 2025``; unparseable values come back as their first ten
+    characters, and empty ones as an em dash."""
+    text = iso(value)
+    return _format(text) if text else EMPTY
+
+
+def days_until(value, today=None):
+    d = parse_date(value)
+    return (d - (today or date.today())).days if d else None
+
+
+def cache_info():
+    return {"parse": _parse.cache_info()._asdict(), "format": _format.cache_info()._asdict()}
@@ -0,0 +1,144 @@
+"""Agenda and minutes documents as TXT, DOCX or PDF.
+
+Documents are built only when someone asks for one, and the rendered bytes are
+kept in an ``ExportCache`` keyed by a hash of the rows they were built from,
+so repeat downloads are free until the meeting, its agenda items or the
+minutes change. DOCX output needs ``python-docx`` and PDF output ``fpdf2``;
+both are optional and imported the first time that format is rendered.
+"""
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+
+FORMATS = {
+    "txt": ("Text (TXT)", "text/plain"),
+    "docx": ("Word (DOCX)", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "pdf": ("PDF", "application/pdf"),
+}
+RULE = "════════════════════════════════════════════"
+
+
+class MissingDependency(RuntimeError):
+    pass
+
+
+def agenda_text(m, items):
+    text = f"""PERSONNEL ADVISORY COMMITTEE\nCowandilla Learning Centre\n\nMEETING AGENDA — {m.meeting_type.upper()} MEETING\nDate: {m.date_label}\nTime: {m.time_label}\nLocation: {m.location}\nChair: {m.chair}\n\n{RULE}\n\nAGENDA\n\n1. Welcome & Acknowledgement of Country\n2. Apologies\n3. Confirmation of previous minutes\n4. Business arising from previous minutes\n5. Correspondence\n6. General Business\n\n"""
+    for i, item in enumerate(items):
+        text += f"   6.{i+1}  [{item.item_type}] {item.item_title}\n"
+        if item.item_description:
+            text += f"         {item.item_description}\n"
+        text += f"         Submitted by: {item.submitted_by}\n\n"
+    return text + f"7. Any Other Business\n8. Date of Next Meeting\n\n{RULE}\nThis agenda has been prepared in accordance with DfE PAC requirements.\n"
+
+
+def minutes_text(m, content):
+    return content
+
+
+DOCUMENTS = {
+    "agenda": ("PAC_Agenda", "Meeting Agenda", agenda_text),
+    "minutes": ("PAC_Minutes", "Meeting Minutes", minutes_text),
+}
+
+
+def file_name(kind, fmt, m):
+    return f"{DOCUMENTS[kind][0]}_{m.meeting_date or ''}.{fmt}"
+
+
+def content_key(kind, fmt, m, source):
+    """Hash of everything the document is built from: the meeting row and the
+    agenda items (or the minutes text)."""
+    rows = [r.to_row() for r in source] if isinstance(source, (list, tuple)) else source
+    payload = json.dumps({"kind": kind, "fmt": fmt, "meeting": m.to_row(), "source": rows}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def render_txt(title, text):
+    return text.encode("utf-8")
+
+
+def render_docx(title, text):
+    try:
+        import docx
+        from docx.shared import Pt
+    except ImportError:
+        raise MissingDependency("Word export needs python-docx: pip install python-docx")
+    doc = docx.Document()
+    doc.core_properties.title = title
+    style = doc.styles["Normal"]
+    style.font.name = "Calibri"
+    style.font.size = Pt(11)
+    for line in text.splitlines():
+        if set(line.strip()) <= {"═"} and line.strip():
+            continue
+        p = doc.add_paragraph(line.strip())
+        p.paragraph_format.left_indent = Pt(6 * (len(line) - len(line.lstrip())))
+        p.paragraph_format.space_after = Pt(2)
+        if line.isupper():
+            p.runs[0].bold = True
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+# The PDF core fonts are Latin-1 only.
+_LATIN1 = str.maketrans({"—": "-", "–": "-", "═": "=", "·": "-", "‘": "'", "’": "'", "“": '"', "”": '"', "…": "..."})
+
+
+def render_pdf(title, text):
+    try:
+        from fpdf import FPDF
+    except ImportError:
+        raise MissingDependency("PDF export needs fpdf2: pip install fpdf2")
+    pdf = FPDF(format="A4")
+    pdf.set_title(title)
+    pdf.set_margins(18, 18)
+    pdf.add_page()
+    for line in text.translate(_LATIN1).encode("latin-1", "replace").decode("latin-1").splitlines():
+        pdf.set_font("Helvetica", "B" if line.isupper() else "", 10)
+        pdf.set_x(18 + 2 * (len(line) - len(line.lstrip())))
+        pdf.multi_cell(0, 5, line.strip() or " ", new_x="LMARGIN", new_y="NEXT")
+    return bytes(pdf.output())
+
+
+RENDERERS = {"txt": render_txt, "docx": render_docx, "pdf": render_pdf}
+
+
+class ExportCache:
+    """Rendered documents by content key, least recently used evicted first
+    once they add up to more than ``max_bytes``."""
+
+    def __init__(self, max_bytes=20_000_000):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_render(self, kind, fmt, m, source, key=None):
+        key = key or content_key(kind, fmt, m, source)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+        _, title, build = DOCUMENTS[kind]
+        data = RENDERERS[fmt](f"PAC {title} — {m.date_label}", build(m, source))
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = data
+                self._bytes += len(data)
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, old = self._entries.popitem(last=False)
+                self._bytes -= len(old)
+        return data
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self._bytes}
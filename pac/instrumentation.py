@@ -0,0 +1,251 @@
+"""Per-rerun instrumentation of Supabase and Anthropic calls.
+
+``Recorder`` collects events into the ``Run`` of the script rerun that caused
+them: every Supabase ``execute()`` (table, operation, latency, rows and bytes
+returned), every Anthropic call (latency and tokens) and named sections timed
+with ``Recorder.section`` (e.g. one per tab). The current run is held in a
+context variable, so concurrent sessions do not mix; calls made outside a
+rerun (worker threads, fragment reruns) go to a shared background run.
+
+``instrument_supabase`` and ``instrument_anthropic`` wrap the clients without
+changing their interface. Finished runs are kept in memory for the admin
+diagnostics panel, exported as JSON lines, and optionally appended to a file.
+"""
+import contextvars
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+_current = contextvars.ContextVar("pac_run", default=None)
+_run_ids = itertools.count(1)
+
+# Events kept per run; the background run lives as long as the process.
+MAX_EVENTS = 5000
+
+WRITE_OPS = ("insert", "update", "upsert", "delete")
+
+
+class Run:
+    def __init__(self, label):
+        self.id = next(_run_ids)
+        self.label = label
+        self.started = time.time()
+        self.elapsed_ms = None
+        self.queries = deque(maxlen=MAX_EVENTS)
+        self.llm_calls = deque(maxlen=MAX_EVENTS)
+        self.sections = {}
+        self._lock = threading.Lock()
+
+    def add_query(self, table, op, ms, rows, nbytes, error=None):
+        with self._lock:
+            self.queries.append({"table": table, "op": op, "ms": round(ms, 2), "rows": rows, "bytes": nbytes, "error": error})
+
+    def add_llm_call(self, model, op, ms, input_tokens, output_tokens, error=None):
+        with self._lock:
+            self.llm_calls.append({"model": model, "op": op, "ms": round(ms, 2), "input_tokens": input_tokens,
+                                   "output_tokens": output_tokens, "error": error})
+
+    def by_table(self):
+        """``{(table, op): {"count", "ms", "max_ms", "rows", "bytes"}}``."""
+        out = {}
+        with self._lock:
+            for q in self.queries:
+                agg = out.setdefault((q["table"], q["op"]), {"count": 0, "ms": 0.0, "max_ms": 0.0, "rows": 0, "bytes": 0})
+                agg["count"] += 1
+                agg["ms"] += q["ms"]
+                agg["max_ms"] = max(agg["max_ms"], q["ms"])
+                agg["rows"] += q["rows"]
+                agg["bytes"] += q["bytes"]
+        return out
+
+    def summary(self):
+        with self._lock:
+            return {"run": self.id, "label": self.label, "started": self.started, "elapsed_ms": self.elapsed_ms,
+                    "queries": len(self.queries), "query_ms": round(sum(q["ms"] for q in self.queries), 2),
+                    "bytes": sum(q["bytes"] for q in self.queries), "llm_calls": len(self.llm_calls),
+                    "sections": dict(self.sections)}
+
+    def to_dict(self):
+        out = self.summary()
+        with self._lock:
+            out.update(query_log=list(self.queries), llm_log=list(self.llm_calls))
+        return out
+
+
+class Recorder:
+    def __init__(self, keep=50, log_path=None):
+        self.runs = deque(maxlen=keep)
+        self.log_path = log_path
+        self.background = Run("background")
+        self._lock = threading.Lock()
+
+    def start_run(self, label="rerun"):
+        run = Run(label)
+        _current.set(run)
+        return run
+
+    def current(self):
+        return _current.get() or self.background
+
+    def finish(self, run):
+        if run.elapsed_ms is not None:
+            return
+        run.elapsed_ms = round((time.time() - run.started) * 1000, 2)
+        if _current.get() is run:
+            _current.set(None)
+        with self._lock:
+            self.runs.append(run)
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(run.to_dict(), default=str) + "\n")
+
+    @contextmanager
+    def section(self, name):
+        run = self.current()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            run.sections[name] = round(run.sections.get(name, 0) + ms, 2)
+
+    def export_jsonl(self):
+        with self._lock:
+            runs = list(self.runs)
+        return "".join(json.dumps(r.to_dict(), default=str) + "\n" for r in runs + [self.background])
+
+
+def _size(data):
+    try:
+        return len(json.dumps(data, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
+class _Builder:
+    """Wraps a postgrest request builder; records the call on ``execute()``."""
+
+    def __init__(self, builder, recorder, table, op):
+        self._builder = builder
+        self._recorder = recorder
+        self._table = table
+        self._op = op
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            return attr
+        if name == "execute":
+            return self._execute
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if hasattr(result, "execute"):
+                op = name if name in ("select",) + WRITE_OPS else self._op
+                return _Builder(result, self._recorder, self._table, op)
+            return result
+        return call
+
+    def _execute(self, *args, **kwargs):
+        run = self._recorder.current()
+        start = time.perf_counter()
+        try:
+            response = self._builder.execute(*args, **kwargs)
+        except Exception as e:
+            run.add_query(self._table, self._op, (time.perf_counter() - start) * 1000, 0, 0, error=type(e).__name__)
+            raise
+        data = getattr(response, "data", None)
+        rows = len(data) if isinstance(data, list) else int(data is not None)
+        run.add_query(self._table, self._op, (time.perf_counter() - start) * 1000, rows, _size(data))
+        return response
+
+
+class InstrumentedSupabase:
+    def __init__(self, client, recorder):
+        self._client = client
+        self._recorder = recorder
+
+    def table(self, name):
+        return _Builder(self._client.table(name), self._recorder, name, "select")
+
+    from_ = table
+
+    def rpc(self, fn, params=None, *args, **kwargs):
+        return _Builder(self._client.rpc(fn, params or {}, *args, **kwargs), self._recorder, f"rpc:{fn}", "rpc")
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def instrument_supabase(client, recorder):
+    return InstrumentedSupabase(client, recorder)
+
+
+def _tokens(message):
+    usage = getattr(message, "usage", None)
+    return getattr(usage, "input_tokens", 0) or 0, getattr(usage, "output_tokens", 0) or 0
+
+
+class _Stream:
+    """Wraps ``messages.stream(...)``; records the call when the stream closes."""
+
+    def __init__(self, manager, recorder, model):
+        self._manager = manager
+        self._recorder = recorder
+        self._model = model
+
+    def __enter__(self):
+        self._run = self._recorder.current()
+        self._start = time.perf_counter()
+        self._stream = self._manager.__enter__()
+        return self._stream
+
+    def __exit__(self, exc_type, exc, tb):
+        ms = (time.perf_counter() - self._start) * 1000
+        tokens = (0, 0)
+        if exc_type is None:
+            try:
+                tokens = _tokens(self._stream.get_final_message())
+            except Exception:
+                pass
+        self._run.add_llm_call(self._model, "stream", ms, *tokens, error=exc_type.__name__ if exc_type else None)
+        return self._manager.__exit__(exc_type, exc, tb)
+
+
+class _Messages:
+    def __init__(self, messages, recorder):
+        self._messages = messages
+        self._recorder = recorder
+
+    def create(self, **kwargs):
+        run = self._recorder.current()
+        start = time.perf_counter()
+        try:
+            message = self._messages.create(**kwargs)
+        except Exception as e:
+            run.add_llm_call(kwargs.get("model"), "create", (time.perf_counter() - start) * 1000, 0, 0, error=type(e).__name__)
+            raise
+        run.add_llm_call(kwargs.get("model"), "create", (time.perf_counter() - start) * 1000, *_tokens(message))
+        return message
+
+    def stream(self, **kwargs):
+        return _Stream(self._messages.stream(**kwargs), self._recorder, kwargs.get("model"))
+
+    def __getattr__(self, name):
+        return getattr(self._messages, name)
+
+
+class InstrumentedAnthropic:
+    def __init__(self, client, recorder):
+        self._client = client
+        self.messages = _Messages(client.messages, recorder)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def instrument_anthropic(client, recorder):
+    return InstrumentedAnthropic(client, recorder)
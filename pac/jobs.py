@@ -0,0 +1,99 @@
+"""Bounded background job queue, shared by every session in the process.
+
+Jobs are keyed (e.g. by meeting id) so a rerun, a tab switch or a second
+admin asking for the same work attaches to the running job instead of
+starting another. At most ``max_workers`` jobs run at once and at most
+``capacity`` may be queued or running; beyond that ``submit`` raises
+``QueueFull`` so callers can ask the user to try again shortly.
+"""
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+class QueueFull(Exception):
+    pass
+
+
+class Job:
+    _ids = itertools.count(1)
+
+    def __init__(self, key, tag=None):
+        self.id = next(self._ids)
+        self.key = key
+        self.tag = tag
+        self.status = QUEUED
+        self.text = ""
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+
+    @property
+    def active(self):
+        return self.status in (QUEUED, RUNNING)
+
+    def update(self, text):
+        """Progress callback: record the partial output so far."""
+        self.text = text
+
+
+class JobQueue:
+    def __init__(self, max_workers=2, capacity=6, keep_finished=3600):
+        self.capacity = capacity
+        self.keep_finished = keep_finished
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pac-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args, tag=None, **kwargs):
+        """Run ``fn(job, *args, **kwargs)`` in the background and return the job.
+
+        If a job for ``key`` is already queued or running, that job is
+        returned instead; ``tag`` (e.g. a hash of the inputs) is kept on the
+        job so the caller can tell whether it is doing the same work.
+        ``fn``'s return value becomes ``job.result``.
+        """
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(key)
+            if job and job.active:
+                return job
+            if sum(j.active for j in self._jobs.values()) >= self.capacity:
+                raise QueueFull(f"{self.capacity} jobs already queued or running")
+            job = self._jobs[key] = Job(key, tag)
+        self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = RUNNING
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.status = DONE
+        except Exception as e:
+            job.error = e
+            job.status = FAILED
+        finally:
+            job.finished = time.time()
+
+    def get(self, key):
+        return self._jobs.get(key)
+
+    def discard(self, key):
+        with self._lock:
+            job = self._jobs.get(key)
+            if job and not job.active:
+                del self._jobs[key]
+
+    def _prune(self):
+        cutoff = time.time() - self.keep_finished
+        for key in [k for k, j in self._jobs.items() if j.finished and j.finished < cutoff]:
+            del self._jobs[key]
+
+    def stats(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {status: sum(j.status == status for j in jobs) for status in (QUEUED, RUNNING, DONE, FAILED)}
@@ -0,0 +1,62 @@
+"""Apply the SQL files in ``migrations/`` to the PAC database.
+
+Supabase's REST API cannot run DDL, so this connects to Postgres directly
+(Project Settings → Database → connection string) and needs ``psycopg``::
+
+    pip install "psycopg[binary]"
+    SUPABASE_DB_URL=postgresql://... python -m pac.migrations
+
+Files are applied in name order, each in its own transaction, and recorded
+in ``pac_schema_migrations`` so every file runs exactly once.
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+
+def pending(applied, directory=MIGRATIONS_DIR):
+    return [p for p in sorted(directory.glob("*.sql")) if p.name not in applied]
+
+
+def migrate(db_url, directory=MIGRATIONS_DIR, dry_run=False):
+    """Apply every migration in ``directory`` not yet recorded; returns the
+    names of the files applied (or, with ``dry_run``, that would be)."""
+    try:
+        import psycopg
+    except ImportError:
+        raise SystemExit('The migration runner needs psycopg: pip install "psycopg[binary]"')
+
+    # Autocommit, so each conn.transaction() below is a transaction of its own
+    # rather than a savepoint in one that spans the whole run.
+    with psycopg.connect(db_url, autocommit=True) as conn:
+        conn.execute("create table if not exists pac_schema_migrations ("
+                     "name text primary key, applied_at timestamptz not null default now())")
+        applied = {row[0] for row in conn.execute("select name from pac_schema_migrations")}
+        todo = pending(applied, directory)
+        if dry_run:
+            return [p.name for p in todo]
+        for path in todo:
+            with conn.transaction():
+                conn.execute(path.read_text())
+                conn.execute("insert into pac_schema_migrations (name) values (%s)", (path.name,))
+        return [p.name for p in todo]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", default=os.environ.get("SUPABASE_DB_URL"),
+                        help="Postgres connection string (default: $SUPABASE_DB_URL)")
+    parser.add_argument("--dry-run", action="store_true", help="list pending migrations without applying them")
+    args = parser.parse_args(argv)
+    if not args.db_url:
+        parser.error("no database URL: pass --db-url or set SUPABASE_DB_URL")
+    names = migrate(args.db_url, dry_run=args.dry_run)
+    verb = "Pending" if args.dry_run else "Applied"
+    print(f"{verb}: {', '.join(names)}" if names else "Database is up to date.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
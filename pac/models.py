@@ -0,0 +1,195 @@
+"""Typed, slotted records for PAC rows.
+
+Rows from Supabase are turned into these once, when they are loaded or patched
+into the read cache, so render code reads plain attributes and every display
+value (dates, times, fallbacks such as "—") is worked out once per row rather
+than on every rerun. Records are frozen because cached ones are shared by all
+sessions; a write produces a new record.
+
+``get`` mirrors ``dict.get`` so the cache's match predicates and sort keys
+work on records and raw rows alike. ``to_row`` gives the column fields as
+displayed (with fallbacks filled in), so it must not be written back: writes
+send only the columns they change.
+"""
+from dataclasses import dataclass, fields
+from datetime import date as Date
+from typing import Any, ClassVar, Optional
+
+from pac.dates import fmt_date, iso, parse_date
+
+EMPTY = "—"
+
+
+def _text(value, default=""):
+    return str(value).strip() if value not in (None, "") else default
+
+
+class Record:
+    __slots__ = ()
+    # Fields worked out from the columns, not columns themselves.
+    DERIVED: ClassVar[tuple] = ()
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def to_row(self):
+        """The column fields, normalised for display (e.g. for hashing); not for writes."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name not in self.DERIVED}
+
+
+@dataclass(frozen=True, slots=True)
+class Meeting(Record):
+    id: Any
+    meeting_date: Optional[str] = None
+    start_time: Optional[str] = None
+    location: str = EMPTY
+    chair: str = EMPTY
+    meeting_type: str = "Ordinary"
+    notice_text: str = ""
+    status: str = "upcoming"
+    date: Optional[Date] = None
+    date_label: str = EMPTY
+    time_label: str = EMPTY
+
+    DERIVED: ClassVar[tuple] = ("date", "date_label", "time_label")
+
+    @classmethod
+    def from_row(cls, row):
+        d = iso(row.get("meeting_date"))
+        t = _text(row.get("start_time"))
+        return cls(id=row["id"], meeting_date=d, start_time=t or None, location=_text(row.get("location"), EMPTY),
+                   chair=_text(row.get("chair"), EMPTY), meeting_type=_text(row.get("meeting_type"), "Ordinary"),
+                   notice_text=_text(row.get("notice_text")), status=_text(row.get("status"), "upcoming"),
+                   date=parse_date(d), date_label=fmt_date(d), time_label=t[:5] or EMPTY)
+
+
+AGENDA_ICONS = {"Information": "ℹ️", "Discussion": "💬", "Decision": "⚖️", "Presentation": "📊"}
+
+
+@dataclass(frozen=True, slots=True)
+class AgendaItem(Record):
+    id: Any
+    meeting_id: Any = None
+    order_no: Optional[int] = None
+    item_title: str = "Untitled"
+    item_description: str = ""
+    item_type: str = "General"
+    submitted_by: str = EMPTY
+    icon: str = "📌"
+
+    DERIVED: ClassVar[tuple] = ("icon",)
+
+    @classmethod
+    def from_row(cls, row):
+        item_type = _text(row.get("item_type"), "General")
+        return cls(id=row["id"], meeting_id=row.get("meeting_id"), order_no=row.get("order_no"),
+                   item_title=_text(row.get("item_title"), "Untitled"), item_description=_text(row.get("item_description")),
+                   item_type=item_type, submitted_by=_text(row.get("submitted_by"), EMPTY),
+                   icon=AGENDA_ICONS.get(item_type, "📌"))
+
+
+@dataclass(frozen=True, slots=True)
+class Attendance(Record):
+    id: Any
+    meeting_id: Any = None
+    staff_name: str = ""
+    role: str = ""
+    attended: bool = False
+    apology: bool = False
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(id=row["id"], meeting_id=row.get("meeting_id"), staff_name=_text(row.get("staff_name")),
+                   role=_text(row.get("role")), attended=bool(row.get("attended")), apology=bool(row.get("apology")))
+
+    @property
+    def absent(self):
+        return not self.attended and not self.apology
+
+
+@dataclass(frozen=True, slots=True)
+class Minutes(Record):
+    id: Any
+    meeting_id: Any = None
+    content: str = ""
+    status: str = "draft"
+    finalised_at: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(id=row["id"], meeting_id=row.get("meeting_id"), content=row.get("content") or "",
+                   status=_text(row.get("status"), "draft"), finalised_at=row.get("finalised_at"))
+
+    @property
+    def finalised(self):
+        return self.status == "finalised"
+
+
+ACTION_STATUSES = ["Pending", "In Progress", "Complete"]
+ACTION_ICONS = {"Pending": "⏳", "In Progress": "🔄", "Complete": "✅"}
+
+
+@dataclass(frozen=True, slots=True)
+class ActionItem(Record):
+    id: Any
+    meeting_id: Any = None
+    action: str = ""
+    responsible_person: str = EMPTY
+    status: str = "Pending"
+    due_date: Optional[str] = None
+    created_at: Optional[str] = None
+    due_label: str = EMPTY
+    icon: str = "⏳"
+
+    DERIVED: ClassVar[tuple] = ("due_label", "icon")
+
+    @classmethod
+    def from_row(cls, row):
+        status = _text(row.get("status"), "Pending")
+        due = iso(row.get("due_date"))
+        return cls(id=row["id"], meeting_id=row.get("meeting_id"), action=_text(row.get("action")),
+                   responsible_person=_text(row.get("responsible_person"), EMPTY), status=status, due_date=due,
+                   created_at=row.get("created_at"), due_label=fmt_date(due), icon=ACTION_ICONS.get(status, "⏳"))
+
+    @property
+    def complete(self):
+        return self.status == "Complete"
+
+    @property
+    def status_index(self):
+        return ACTION_STATUSES.index(self.status) if self.status in ACTION_STATUSES else 0
+
+
+@dataclass(frozen=True, slots=True)
+class Document(Record):
+    id: Any
+    meeting_id: Any = None
+    document_name: str = ""
+    document_url: str = "#"
+    description: str = ""
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(id=row["id"], meeting_id=row.get("meeting_id"), document_name=_text(row.get("document_name")),
+                   document_url=_text(row.get("document_url"), "#"), description=_text(row.get("description")))
+
+
+MODELS = {
+    "pac_meetings": Meeting,
+    "pac_agenda_items": AgendaItem,
+    "pac_attendance": Attendance,
+    "pac_minutes": Minutes,
+    "pac_action_items": ActionItem,
+    "pac_documents": Document,
+}
+
+
+def record(table, row):
+    """``row`` as its table's record type (rows of other tables, and rows
+    that already are records, are returned unchanged)."""
+    model = MODELS.get(table)
+    return model.from_row(row) if model is not None and isinstance(row, dict) else row
+
+
+def records(table, rows):
+    return [record(table, row) for row in rows]
@@ -0,0 +1,132 @@
+"""Realtime change feed: keep the shared read cache current from Postgres changes.
+
+A ``ChangeFeed`` takes row-level change events from an event source and applies
+them to the process-wide ``TTLCache`` with ``TTLCache.patch``, the same path the
+app's own writes use. While the source is connected, cached reads never expire,
+so sessions render from memory and only cold misses go to Supabase. If the
+source drops, the TTL is restored and the cache cleared, since events may have
+been missed.
+
+Two sources are provided: ``SupabaseEventSource`` subscribes to Supabase
+Realtime (the tables must be in the ``supabase_realtime`` publication, see
+migrations/003_realtime_publication.sql), and ``LocalEventSource`` is an
+in-process stand-in that lets the feed be driven without a network.
+
+Events are dicts with ``table``, ``type`` (``INSERT``/``UPDATE``/``DELETE``),
+``record`` (the new row) and ``old_record`` (for deletes, at least the id).
+"""
+import asyncio
+import threading
+import time
+
+PAC_TABLES = ["pac_meetings", "pac_agenda_items", "pac_attendance", "pac_minutes", "pac_action_items", "pac_documents"]
+
+
+class ChangeFeed:
+    def __init__(self, cache, source):
+        self.cache = cache
+        self.source = source
+        self.ttl = cache.ttl
+        self.connected = False
+        self.events = 0
+        self.last_event = None
+
+    def start(self):
+        self.source.start(self.apply, self.set_connected)
+        return self
+
+    def stop(self):
+        self.source.stop()
+        self.set_connected(False)
+
+    def set_connected(self, connected):
+        if connected == self.connected:
+            return
+        self.connected = connected
+        if connected:
+            self.cache.ttl = None
+        else:
+            self.cache.ttl = self.ttl
+            self.cache.clear()
+
+    def apply(self, event):
+        kind = (event.get("type") or "").upper()
+        if event.get("table") not in PAC_TABLES or kind not in ("INSERT", "UPDATE", "DELETE"):
+            return
+        row = event.get("old_record") if kind == "DELETE" else event.get("record")
+        if not row or "id" not in row:
+            return
+        self.cache.patch(event["table"], row, deleted=kind == "DELETE")
+        self.events += 1
+        self.last_event = time.time()
+
+    def stats(self):
+        return {"connected": self.connected, "events": self.events, "last_event": self.last_event}
+
+
+class LocalEventSource:
+    """In-process event source: ``emit`` delivers an event straight to the feed."""
+
+    def __init__(self):
+        self.on_event = None
+        self.on_status = None
+
+    def start(self, on_event, on_status):
+        self.on_event = on_event
+        self.on_status = on_status
+        on_status(True)
+
+    def stop(self):
+        if self.on_status:
+            self.on_status(False)
+        self.on_event = self.on_status = None
+
+    def emit(self, table, type, record=None, old_record=None):
+        if self.on_event:
+            self.on_event({"table": table, "type": type, "record": record, "old_record": old_record})
+
+
+class SupabaseEventSource:
+    """Supabase Realtime ``postgres_changes`` subscription on the PAC tables,
+    run on an asyncio loop in a daemon thread."""
+
+    def __init__(self, url, key, tables=PAC_TABLES, schema="public"):
+        self.url = url
+        self.key = key
+        self.tables = tables
+        self.schema = schema
+        self._loop = None
+        self._client = None
+
+    def start(self, on_event, on_status):
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="pac-realtime", daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._subscribe(on_event, on_status), self._loop)
+
+    async def _subscribe(self, on_event, on_status):
+        from supabase import acreate_client
+
+        def handle(payload):
+            data = payload.get("data", payload)
+            on_event({
+                "table": data.get("table"),
+                "type": data.get("type") or data.get("eventType"),
+                "record": data.get("record") or data.get("new"),
+                "old_record": data.get("old_record") or data.get("old"),
+            })
+
+        def status(state, err=None):
+            on_status(str(state).upper().endswith("SUBSCRIBED"))
+
+        self._client = await acreate_client(self.url, self.key)
+        channel = self._client.channel("pac-changes")
+        for table in self.tables:
+            channel.on_postgres_changes("*", schema=self.schema, table=table, callback=handle)
+        await channel.subscribe(status)
+
+    def stop(self):
+        if self._loop:
+            if self._client:
+                asyncio.run_coroutine_threadsafe(self._client.remove_all_channels(), self._loop)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
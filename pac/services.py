@@ -0,0 +1,70 @@
+"""Process-wide services for the PAC app, created once per server process.
+
+Each ``init_*`` function is an ``st.cache_resource`` singleton shared by all
+sessions. The Supabase client library is imported when the client is first
+created rather than when this module is imported.
+"""
+import streamlit as st
+
+from pac.actions import ActionIndex
+from pac.cache import TTLCache
+from pac.instrumentation import Recorder, instrument_supabase
+from pac.models import record
+from pac.realtime import ChangeFeed, SupabaseEventSource
+
+
+# Every Supabase and Anthropic call is recorded against the rerun that made it;
+# admins see the numbers in the diagnostics panel at the bottom of the page.
+@st.cache_resource
+def init_recorder() -> Recorder:
+    return Recorder(keep=int(st.secrets.get("PAC_METRICS_RUNS", 50)), log_path=st.secrets.get("PAC_METRICS_LOG"))
+
+
+@st.cache_resource
+def init_supabase():
+    from supabase import create_client
+    return instrument_supabase(create_client(st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"]), init_recorder())
+
+
+# Shared by every session in this server process. Reads are served from memory
+# for PAC_CACHE_TTL seconds and concurrent misses share one query; the write
+# helpers in pac.data patch whatever a write touches, so changes still show up
+# immediately.
+@st.cache_resource
+def init_cache() -> TTLCache:
+    from pac.data import SEARCH_TABLES
+    c = TTLCache(maxsize=int(st.secrets.get("PAC_CACHE_SIZE", 2048)),
+                 ttl=float(st.secrets.get("PAC_CACHE_TTL", 60)),
+                 max_rows=int(st.secrets.get("PAC_CACHE_MAX_ROWS", 200_000)), records=record)
+    # Search hits span several tables, so a write to any of them drops them all.
+    c.subscribe(lambda table, row, deleted: table in SEARCH_TABLES and c.invalidate("pac_search"))
+    return c
+
+
+# With PAC_REALTIME enabled (after migrations/003_realtime_publication.sql),
+# Postgres changes made anywhere are applied to the cache as they happen and
+# cached reads stop expiring, so sessions render from memory.
+@st.cache_resource
+def init_change_feed():
+    if not st.secrets.get("PAC_REALTIME", False):
+        return None
+    return ChangeFeed(init_cache(), SupabaseEventSource(st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"])).start()
+
+
+# Action register counts (by status and person, and overdue), grouped by the
+# database and rebuilt after action writes or once PAC_CACHE_TTL old, instead
+# of recounted per rerun. Built the first time the Action Register is shown.
+@st.cache_resource
+def init_action_index() -> ActionIndex:
+    index = ActionIndex(lambda: init_supabase().rpc("pac_action_counts").execute().data,
+                        max_age=float(st.secrets.get("PAC_CACHE_TTL", 60)))
+    init_cache().subscribe(index.listener)
+    return index
+
+
+# Rendered agenda and minutes downloads (TXT/DOCX/PDF), keyed by a hash of the
+# rows they come from, so a document is built once per version of the meeting.
+@st.cache_resource
+def init_export_cache():
+    from pac.exports import ExportCache
+    return ExportCache(int(st.secrets.get("PAC_EXPORT_CACHE_MB", 20)) * 1_000_000)
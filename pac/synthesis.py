@@ -0,0 +1,286 @@
+"""Otter transcript → PAC minutes synthesis with Claude.
+
+Short transcripts go to the model in a single prompt. Long ones are split on
+speaker/timestamp boundaries, each chunk is condensed into per-section notes
+concurrently (map), and the notes fill the proforma in a final pass (reduce).
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from pac.dates import fmt_date
+
+MODEL = "claude-opus-4-5"
+MAX_TOKENS = 4000
+
+# Transcripts longer than this are synthesised chunk by chunk.
+CHUNK_CHARS = 24000
+MAP_MAX_TOKENS = 1500
+MAP_WORKERS = 4
+
+# An Otter speaker turn starts with a line like "Jane Smith  12:34" or "(1:02:03)".
+TURN_RE = re.compile(r"^[^\S\n]*(?:[^\n]{1,60}?[^\S\n]+)?\(?\d{1,2}:\d{2}(?::\d{2})?\)?[^\S\n]*$", re.M)
+# Just after a sentence's closing punctuation and the space that follows it.
+SENTENCE_RE = re.compile(r"(?<=[.!?]\s)")
+
+PROMPT = """You are helping produce formal meeting minutes for the Personnel Advisory Committee (PAC) at Cowandilla Learning Centre, South Australia.
+
+Below is {source} of the meeting. Please synthesise it into the standard DfE PAC minutes proforma with all 8 sections. Be concise but accurate. Use formal language appropriate for official minutes. Do not include timestamps or speaker labels in the output.
+
+MEETING DETAILS:
+- Date: {date}
+- Time: {time}
+- Location: {location}
+- Chair: {chair}
+- Present: {present}
+- Apologies: {apologies}
+- Agenda items: {agenda_items}
+
+{source_label}:
+{transcript}
+
+Please produce the minutes in EXACTLY this format:
+
+PERSONNEL ADVISORY COMMITTEE
+Cowandilla Learning Centre
+{meeting_type} MEETING MINUTES
+
+Date: {date}
+Time: {time}
+Location: {location}
+Chair: {chair}
+
+════════════════════════════════════════════
+
+1. WELCOME & ACKNOWLEDGEMENT OF COUNTRY
+   [Extract from transcript]
+
+2. APOLOGIES
+   Apologies received from: {apologies}
+   Present: {present}
+
+3. CONFIRMATION OF PREVIOUS MINUTES
+   [Extract from transcript]
+
+4. BUSINESS ARISING FROM PREVIOUS MINUTES
+   [Extract from transcript]
+
+5. CORRESPONDENCE
+   Inwards: [Extract from transcript]
+   Outwards: [Extract from transcript]
+
+6. GENERAL BUSINESS
+   [For each agenda item discussed, write a numbered sub-section with Discussion and Outcome]
+
+7. ANY OTHER BUSINESS
+   [Extract from transcript]
+
+8. DATE OF NEXT MEETING
+   [Extract from transcript]
+
+════════════════════════════════════════════
+Meeting closed at: [Extract from transcript]
+Minutes prepared by: 
+Date prepared: {prepared}
+"""
+
+
+MAP_PROMPT = """You are helping produce formal meeting minutes for the Personnel Advisory Committee (PAC) at Cowandilla Learning Centre, South Australia.
+
+Below is part {part} of {parts} of an Otter.ai transcript of the meeting. Write concise notes of what this part covers, grouped under whichever of these headings it touches, in this order:
+
+1. WELCOME & ACKNOWLEDGEMENT OF COUNTRY
+2. APOLOGIES
+3. CONFIRMATION OF PREVIOUS MINUTES
+4. BUSINESS ARISING FROM PREVIOUS MINUTES
+5. CORRESPONDENCE
+6. GENERAL BUSINESS (one sub-heading per agenda item, with discussion and outcome)
+7. ANY OTHER BUSINESS
+8. DATE OF NEXT MEETING
+MEETING CLOSED
+
+Agenda items: {agenda_items}
+
+Omit headings this part does not touch. Keep names, decisions, figures and dates exactly. Do not include timestamps or speaker labels.
+
+TRANSCRIPT PART {part} OF {parts}:
+{transcript}
+"""
+
+
+def build_prompt(details, transcript, from_notes=False):
+    """``details`` holds the display strings for the meeting: meeting_type,
+    date, time, location, chair, present, apologies and agenda_items."""
+    if from_notes:
+        source, source_label = "a set of notes taken, in order, from an Otter.ai transcript", "TRANSCRIPT NOTES"
+    else:
+        source, source_label = "an Otter.ai transcript", "OTTER TRANSCRIPT"
+    return PROMPT.format(**details, transcript=transcript, source=source, source_label=source_label,
+                         prepared=fmt_date(date.today()))
+
+
+def _pieces(text, max_chars):
+    """``text`` cut into pieces of at most ``max_chars``: at line breaks, then
+    sentence ends, then (for a run-on sentence) the last space, then anywhere."""
+    if len(text) <= max_chars:
+        return [text]
+    for split in (lambda t: t.splitlines(keepends=True), lambda t: [p for p in SENTENCE_RE.split(t) if p]):
+        parts = split(text)
+        if len(parts) > 1:
+            return [p for part in parts for p in _pieces(part, max_chars)]
+    cut = text.rfind(" ", 0, max_chars) + 1 or max_chars
+    return [text[:cut]] + _pieces(text[cut:], max_chars)
+
+
+def split_transcript(transcript, max_chars=CHUNK_CHARS):
+    """Split ``transcript`` into chunks of at most ``max_chars``, breaking
+    between speaker turns where possible. A turn longer than ``max_chars``
+    (e.g. a transcript pasted as one paragraph) is cut at lines, then
+    sentences, then words, so no chunk is ever longer than ``max_chars``."""
+    starts = [m.start() for m in TURN_RE.finditer(transcript)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    turns = [transcript[a:b] for a, b in zip(starts, starts[1:] + [len(transcript)])]
+
+    chunks, current = [], ""
+    for turn in turns:
+        for piece in _pieces(turn, max_chars):
+            if current and len(current) + len(piece) > max_chars:
+                chunks.append(current)
+                current = ""
+            current += piece
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+
+def summarise_chunks(client, chunks, details, max_workers=MAP_WORKERS, usage=None):
+    """Condense each chunk into per-section notes, concurrently. Returns the
+    notes in transcript order."""
+    lock = threading.Lock()
+
+    def summarise(part):
+        i, chunk = part
+        prompt = MAP_PROMPT.format(part=i + 1, parts=len(chunks), agenda_items=details["agenda_items"], transcript=chunk)
+        response = client.messages.create(model=MODEL, max_tokens=MAP_MAX_TOKENS,
+                                          messages=[{"role": "user", "content": prompt}])
+        with lock:
+            add_usage(usage, response.usage)
+        return response.content[0].text
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(summarise, enumerate(chunks)))
+
+
+def add_usage(usage, response_usage):
+    if usage is not None and response_usage is not None:
+        usage["input_tokens"] = usage.get("input_tokens", 0) + response_usage.input_tokens
+        usage["output_tokens"] = usage.get("output_tokens", 0) + response_usage.output_tokens
+
+
+def stream_minutes(client, prompt, on_text=None, usage=None):
+    """Stream the minutes from ``client`` (an ``anthropic.Anthropic``), calling
+    ``on_text(text_so_far)`` as each chunk arrives. Returns the full text and
+    adds the token counts into ``usage`` if given."""
+    parts = []
+    with client.messages.stream(model=MODEL, max_tokens=MAX_TOKENS,
+                                messages=[{"role": "user", "content": prompt}]) as stream:
+        for chunk in stream.text_stream:
+            parts.append(chunk)
+            if on_text:
+                on_text("".join(parts))
+        add_usage(usage, stream.get_final_message().usage)
+    return "".join(parts)
+
+
+def synthesise(client, details, transcript, on_text=None, max_workers=MAP_WORKERS, cache=None):
+    """Produce the minutes for ``transcript``, streaming the final pass through
+    ``on_text``. Long transcripts are map-reduced over chunks. With a
+    ``SynthesisCache``, identical inputs are answered without calling the API."""
+    key = cache.key(details, transcript) if cache else None
+    if cache:
+        text = cache.get(key)
+        if text is not None:
+            if on_text:
+                on_text(text)
+            return text
+
+    usage = {}
+    chunks = split_transcript(transcript)
+    if len(chunks) <= 1:
+        text = stream_minutes(client, build_prompt(details, transcript), on_text, usage)
+    else:
+        notes = summarise_chunks(client, chunks, details, max_workers, usage)
+        joined = "\n\n".join(f"--- Part {i + 1} of {len(notes)} ---\n{n}" for i, n in enumerate(notes))
+        text = stream_minutes(client, build_prompt(details, joined, from_notes=True), on_text, usage)
+    if cache:
+        cache.put(key, text, usage)
+    return text
+
+
+class SynthesisCache:
+    """Content-addressed on-disk cache of synthesised minutes.
+
+    Entries are keyed by a hash of everything that goes into the prompt, so a
+    repeat request for the same transcript and meeting inputs is served from
+    disk. The least recently used entries are evicted once the directory
+    grows past ``max_bytes``.
+    """
+
+    def __init__(self, directory, max_bytes=50_000_000):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(details, transcript):
+        # build_prompt stamps today's date into the minutes, so entries last a day.
+        payload = json.dumps({"model": MODEL, "prompt": PROMPT, "map_prompt": MAP_PROMPT, "chunk_chars": CHUNK_CHARS,
+                              "prepared": fmt_date(date.today()), "details": details, "transcript": transcript},
+                             sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        path = self.directory / f"{key}.json"
+        with self._lock:
+            try:
+                entry = json.loads(path.read_text())
+                os.utime(path)
+            except (OSError, ValueError):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.saved_tokens += entry["usage"].get("input_tokens", 0) + entry["usage"].get("output_tokens", 0)
+            return entry["text"]
+
+    def put(self, key, text, usage):
+        path = self.directory / f"{key}.json"
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with self._lock:
+            tmp.write_text(json.dumps({"text": text, "usage": usage, "created": time.time()}))
+            os.replace(tmp, path)
+            self._evict()
+
+    def _evict(self):
+        entries = sorted(((p.stat().st_mtime, p.stat().st_size, p) for p in self.directory.glob("*.json")),
+                         key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "saved_tokens": self.saved_tokens,
+                "entries": len(list(self.directory.glob("*.json")))}
@@ -0,0 +1,120 @@
+"""Minutes synthesis from Otter transcripts, for the admin minutes editor.
+
+Jobs run on a small worker pool shared by all sessions, one job per meeting,
+so a rerun or tab switch does not kill or duplicate them. The Anthropic SDK is
+imported by the worker that makes the call, so this module (and the SDK) is
+only loaded for admins.
+"""
+import streamlit as st
+
+from pac import synthesis
+from pac.data import db_agenda, db_attendance
+from pac.instrumentation import instrument_anthropic
+from pac.jobs import JobQueue, QueueFull
+from pac.services import init_recorder
+
+
+@st.cache_resource
+def init_synthesis_jobs() -> JobQueue:
+    return JobQueue(max_workers=int(st.secrets.get("PAC_SYNTH_WORKERS", 2)),
+                    capacity=int(st.secrets.get("PAC_SYNTH_QUEUE", 6)))
+
+
+# Synthesised minutes keyed by a hash of the prompt inputs, so re-running the
+# same transcript (after a rerun or a discard) does not call the API again.
+@st.cache_resource
+def init_synthesis_cache() -> synthesis.SynthesisCache:
+    return synthesis.SynthesisCache(st.secrets.get("PAC_SYNTH_CACHE_DIR", ".pac_cache/synthesis"),
+                                    int(st.secrets.get("PAC_SYNTH_CACHE_MB", 50)) * 1_000_000)
+
+
+# Runs on a pool thread, outside any script run: everything it needs from
+# Streamlit (the recorder included) is passed in.
+def run_synthesis(job, recorder, api_key, details, transcript, synth_cache):
+    import anthropic
+    client = instrument_anthropic(anthropic.Anthropic(api_key=api_key), recorder)
+    return synthesis.synthesise(client, details, transcript, job.update, cache=synth_cache)
+
+
+@st.fragment(run_every=1.5)
+def synthesis_job_panel(mid):
+    job = init_synthesis_jobs().get(mid)
+    if job is None or not job.active:
+        # Finished: a full rerun hands the outcome to synthesis_panel and stops the polling.
+        st.rerun()
+    st.info("⏳ Waiting for a free synthesis slot..." if job.status == "queued" else "✍️ Claude is writing your minutes...")
+    if job.text:
+        st.markdown(f'<div class="minutes-box">{job.text}</div>', unsafe_allow_html=True)
+
+
+def synthesis_panel(mid, m):
+    st.markdown("#### 🎙️ Synthesise from Otter Transcript")
+    st.markdown('<div class="info-box">Paste your Otter transcript below and Claude will automatically sort it into the correct PAC proforma sections.</div>', unsafe_allow_html=True)
+
+    with st.expander("📋 Paste Otter Transcript & Synthesise", expanded=False):
+        transcript = st.text_area(
+            "Paste Otter transcript here",
+            height=200,
+            key=f"otter_{mid}",
+            placeholder="Paste your full Otter transcript here — speaker labels, timestamps and all. Claude will sort it into the PAC proforma sections automatically.",
+            label_visibility="collapsed"
+        )
+
+        if st.button("✨ Synthesise into Minutes", key=f"synth_{mid}", type="primary", use_container_width=True):
+            if not transcript.strip():
+                st.warning("Please paste a transcript first.")
+            else:
+                items = db_agenda(mid)
+                attendance = db_attendance(mid)
+                details = {
+                    "meeting_type": m.meeting_type.upper(),
+                    "date": m.date_label,
+                    "time": m.time_label,
+                    "location": m.location,
+                    "chair": m.chair,
+                    "present": ", ".join([a.staff_name for a in attendance if a.attended]) or "—",
+                    "apologies": ", ".join([a.staff_name for a in attendance if a.apology]) or "Nil",
+                    "agenda_items": ", ".join([item.item_title for item in items]) or "none recorded",
+                }
+                inputs = synthesis.SynthesisCache.key(details, transcript)
+                try:
+                    job = init_synthesis_jobs().submit(mid, run_synthesis, init_recorder(), st.secrets["ANTHROPIC_API_KEY"],
+                                                       details, transcript, init_synthesis_cache(), tag=inputs)
+                    if job.tag != inputs:
+                        st.warning("Minutes are already being synthesised for this meeting from a different transcript "
+                                   "or meeting details. Wait for them to finish, then synthesise again.")
+                except QueueFull:
+                    st.warning("Several syntheses are already running — please try again in a minute.")
+
+        # The job outlives this script run; poll it until it finishes, then
+        # take its outcome once.
+        job = init_synthesis_jobs().get(mid)
+        if job and job.active:
+            synthesis_job_panel(mid)
+        elif job and st.session_state.get(f"synth_job_{mid}") != job.id:
+            st.session_state[f"synth_job_{mid}"] = job.id
+            if job.error is not None:
+                st.error(f"Synthesis failed: {job.error}")
+            else:
+                st.session_state[f"synthesised_mins_{mid}"] = job.result
+
+        synth_stats = init_synthesis_cache().stats()
+        st.caption(f"Synthesis cache: {synth_stats['hits']} hits · {synth_stats['misses']} misses · "
+                   f"{synth_stats['saved_tokens']:,} tokens saved · {synth_stats['entries']} stored")
+
+    # Show synthesised result and allow loading into editor
+    if st.session_state.get(f"synthesised_mins_{mid}"):
+        st.markdown("**✨ Synthesised Minutes Preview:**")
+        st.markdown(f'<div class="minutes-box">{st.session_state[f"synthesised_mins_{mid}"]}</div>', unsafe_allow_html=True)
+        col_load, col_clear = st.columns(2)
+        with col_load:
+            if st.button("📥 Load into Editor", key=f"load_synth_{mid}", type="primary", use_container_width=True):
+                st.session_state[f"mins_override_{mid}"] = st.session_state[f"synthesised_mins_{mid}"]
+                st.session_state[f"synthesised_mins_{mid}"] = None
+                init_synthesis_jobs().discard(mid)
+                st.rerun(scope="fragment")
+        with col_clear:
+            if st.button("🗑️ Discard", key=f"clear_synth_{mid}", use_container_width=True):
+                st.session_state[f"synthesised_mins_{mid}"] = None
+                init_synthesis_jobs().discard(mid)
+                st.rerun(scope="fragment")
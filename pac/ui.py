@@ -0,0 +1,59 @@
+"""Small UI helpers shared by the PAC views."""
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+STATUS_COLORS = {"upcoming": "badge-upcoming", "open": "badge-open", "draft": "badge-draft", "finalised": "badge-finalised"}
+STATUS_LABELS = {"upcoming": "Upcoming", "open": "Open", "draft": "Draft Minutes", "finalised": "Finalised"}
+
+
+@lru_cache(maxsize=1)
+def stylesheet():
+    """The app's CSS (pac/static/app.css), read once per process."""
+    return (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8")
+
+
+def check_admin():
+    if "is_admin" not in st.session_state:
+        st.session_state.is_admin = False
+    return st.session_state.is_admin
+
+
+def page_index(key):
+    return max(int(st.session_state.get(key, 1)), 1) - 1
+
+
+def page_controls(total, size, key):
+    pages = max(1, -(-total // size))
+    if pages == 1:
+        return
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key)
+
+
+def export_controls(kind, m, source, key):
+    """Format picker and download for an agenda or minutes document. Nothing is
+    rendered until "Prepare" is clicked; the download is then served from the
+    export cache until ``source`` changes, when it has to be prepared again."""
+    from pac.exports import FORMATS, MissingDependency, content_key, file_name
+    from pac.services import init_export_cache
+
+    c1, c2 = st.columns([2, 1])
+    with c1:
+        fmt = st.selectbox("Format", list(FORMATS), format_func=lambda f: FORMATS[f][0], key=f"{key}_fmt",
+                           label_visibility="collapsed")
+    with c2:
+        ck = content_key(kind, fmt, m, source)
+        if st.session_state.get(f"{key}_ready") != ck:
+            if not st.button("📄 Prepare download", key=f"{key}_prep", use_container_width=True):
+                return
+            st.session_state[f"{key}_ready"] = ck
+        try:
+            data = init_export_cache().get_or_render(kind, fmt, m, source, ck)
+        except MissingDependency as e:
+            st.warning(str(e))
+            return
+        st.download_button(f"⬇️ Download {kind.title()}", data, file_name=file_name(kind, fmt, m), mime=FORMATS[fmt][1],
+                           key=f"{key}_dl", use_container_width=True)
@@ -0,0 +1,18 @@
+"""The app's views, one module each, imported the first time they are shown.
+
+``VIEWS`` maps each top-level view (a module in this package) to its label in
+the navigation. Only the selected view runs on a rerun, so a visitor who never
+opens the Archive never loads or queries it.
+"""
+import importlib
+
+VIEWS = {
+    "meetings": "📅 All Meetings",
+    "upcoming": "⏭ Upcoming Meetings",
+    "actions": "✅ Action Register",
+    "archive": "🗄️ Archive",
+}
+
+
+def render(name):
+    importlib.import_module(f"pac.views.{name}").render()
@@ -0,0 +1,59 @@
+"""Action Register: every action item across meetings, paged server-side."""
+import streamlit as st
+
+from pac.actions import cutoff, is_overdue
+from pac.data import ACTION_PAGE_SIZE, db_action_page, db_meetings_by_id, db_update
+from pac.services import init_action_index
+from pac.ui import check_admin, page_controls, page_index
+
+
+def render():
+    st.markdown("### ✅ Full Action Register — All Meetings")
+    # Two queries whatever the archive size: one per list, paged server-side
+    # once a list grows past ACTION_PAGE_SIZE. Meeting details come from the
+    # cache, plus one index lookup for meetings not read yet.
+    pending, pending_total = db_action_page(False, page_index("reg_pending_page"))
+    completed, completed_total = db_action_page(True, page_index("reg_done_page"))
+    meetings_by_id = db_meetings_by_id([a.meeting_id for a in pending + completed])
+    def meeting_label(a):
+        am = meetings_by_id.get(a.meeting_id)
+        return f"{am.meeting_type} {am.date_label}" if am else "—"
+
+    # Overdue means due before this ISO date; due dates are compared as strings.
+    today_iso = cutoff()
+
+    if not pending_total and not completed_total:
+        st.markdown('<div class="info-box">No action items recorded yet.</div>', unsafe_allow_html=True)
+    else:
+        counts = init_action_index().summary(today_iso)
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total Actions", counts["total"])
+        col2.metric("Pending / In Progress", counts["pending"])
+        col3.metric("Complete", counts["complete"])
+        col4.metric("Overdue", counts["overdue"])
+        with st.expander("By responsible person"):
+            for person, n in sorted(counts["by_person"].items(), key=lambda kv: (-kv[1], kv[0])):
+                st.markdown(f"**{person}** — {n}")
+        st.markdown("---")
+
+        if pending_total:
+            st.markdown("#### Pending / In Progress")
+            page_controls(pending_total, ACTION_PAGE_SIZE, "reg_pending_page")
+            for a in pending:
+                overdue = " 🔴 OVERDUE" if is_overdue(a, today_iso) else ""
+                st.markdown(f'<div class="action-item"><strong>{a.icon} {a.action}</strong>{overdue}<br><small>👤 {a.responsible_person} &nbsp;·&nbsp; 📅 Due: {a.due_label} &nbsp;·&nbsp; Meeting: {meeting_label(a)}</small></div>', unsafe_allow_html=True)
+                if check_admin():
+                    c1, c2 = st.columns([3,1])
+                    with c1:
+                        new_st = st.selectbox("Update", ["Pending","In Progress","Complete"], index=a.status_index, key=f"reg_st_{a.id}")
+                    with c2:
+                        st.write(""); st.write("")
+                        if st.button("Save", key=f"reg_upd_{a.id}"):
+                            db_update("pac_action_items", {"status": new_st}, {"id": a.id}, a.meeting_id)
+                            st.rerun()
+
+        if completed_total:
+            with st.expander(f"View completed actions ({completed_total})"):
+                page_controls(completed_total, ACTION_PAGE_SIZE, "reg_done_page")
+                for a in completed:
+                    st.markdown(f'<div class="action-item action-done"><strong>✅ {a.action}</strong><br><small>👤 {a.responsible_person} &nbsp;·&nbsp; Meeting: {meeting_label(a)}</small></div>', unsafe_allow_html=True)
@@ -0,0 +1,117 @@
+"""Archive: finalised meetings, indexed by year; details load when opened."""
+import tempfile
+from datetime import date
+
+import streamlit as st
+
+from pac.data import ARCHIVE_PAGE_SIZE, db_archive_index, db_archive_years, db_children, db_update
+from pac.services import init_supabase
+from pac.ui import check_admin, export_controls, page_controls, page_index
+
+
+# The ZIP is written to an anonymous temporary file a batch of meetings at a
+# time (see pac.archive_export); the file is gone as soon as it has been handed
+# to the download button, so no personnel records are left on disk. Streamlit
+# holds the offered download in memory, so the button is shown only in the run
+# that built it, and very large ranges are better exported from the command line.
+@st.fragment
+def bulk_export():
+    with st.expander("📦 Bulk export for audit"):
+        st.caption("One ZIP with the minutes, attendance and action registers of every finalised meeting in the range.")
+        c1, c2 = st.columns(2)
+        since = c1.date_input("From", value=date(date.today().year, 1, 1), key="arc_zip_since", format="DD/MM/YYYY")
+        until = c2.date_input("To", value=date.today(), key="arc_zip_until", format="DD/MM/YYYY")
+        if st.button("Build ZIP", key="arc_zip_build", type="primary"):
+            from pac.archive_export import export_archive
+            status = st.empty()
+            with tempfile.TemporaryFile() as out:
+                n = export_archive(init_supabase(), out, str(since), str(until),
+                                   progress=lambda n: status.caption(f"{n} meetings written…"))
+                size = out.tell()
+                out.seek(0)
+                status.empty()
+                name = f"PAC_Archive_{since}_{until}.zip"
+                st.download_button(f"⬇️ Download {name} ({n} meetings, {size / 1_000_000:.1f} MB)", out.read(),
+                                   file_name=name, mime="application/zip", key="arc_zip_dl")
+            st.caption("The download is offered once; build again to download it again.")
+        st.caption("Large ranges: `python -m pac.archive_export --since YYYY-MM-DD --until YYYY-MM-DD -o archive.zip`")
+
+
+def render():
+    st.markdown("### 🗄️ Archive — Finalised Meetings")
+    st.markdown("Meetings move here automatically when minutes are finalised.")
+
+    # Only a lightweight index is loaded for the list; a meeting's minutes,
+    # attendance and actions are fetched when it is opened.
+    col_y, _ = st.columns([1, 3])
+    with col_y:
+        arc_year = st.selectbox("Year", ["All years"] + db_archive_years(), key="arc_year",
+                                on_change=lambda: st.session_state.update(arc_page=1))
+    if check_admin():
+        bulk_export()
+    archived, archived_total = db_archive_index(None if arc_year == "All years" else arc_year, page_index("arc_page"))
+
+    if not archived_total and arc_year != "All years":
+        st.markdown(f'<div class="info-box">No finalised meetings in {arc_year}.</div>', unsafe_allow_html=True)
+    elif not archived_total:
+        st.markdown('<div class="info-box">No finalised meetings yet. Once you finalise a meeting\'s minutes, it will appear here.</div>', unsafe_allow_html=True)
+    else:
+        st.markdown(f"**{archived_total} finalised meeting{'s' if archived_total != 1 else ''} on record**")
+        page_controls(archived_total, ARCHIVE_PAGE_SIZE, "arc_page")
+        st.markdown("---")
+
+        for m in archived:
+            with st.expander(f"📋 {m.meeting_type} Meeting — {m.date_label}"):
+                col1, col2, col3 = st.columns(3)
+                col1.markdown(f"**📅 Date:** {m.date_label}")
+                col2.markdown(f"**📍 Location:** {m.location}")
+                col3.markdown(f"**👤 Chair:** {m.chair}")
+                st.markdown("---")
+
+                if not st.toggle("Show minutes, attendance & actions", key=f"arc_open_{m.id}"):
+                    st.caption("Minutes, attendance and actions load when you open them.")
+                else:
+                    arc_children = {t: db_children(t, [m.id])[m.id] for t in ("pac_minutes", "pac_attendance", "pac_action_items")}
+                    arc_mins = arc_children["pac_minutes"]
+                    arc1, arc2, arc3 = st.tabs(["📝 Minutes", "👥 Attendance", "✅ Actions"])
+
+                    with arc1:
+                        mins = arc_mins[0] if arc_mins else None
+                        if mins and mins.content:
+                            st.markdown(f'<div class="minutes-box">{mins.content}</div>', unsafe_allow_html=True)
+                            export_controls("minutes", m, mins.content, f"arc_export_{m.id}")
+                        else:
+                            st.markdown('<div class="info-box">No minutes recorded for this meeting.</div>', unsafe_allow_html=True)
+
+                    with arc2:
+                        attendance = arc_children["pac_attendance"]
+                        if attendance:
+                            present = [a for a in attendance if a.attended]
+                            apologies = [a for a in attendance if a.apology]
+                            col_p, col_a = st.columns(2)
+                            with col_p:
+                                st.markdown(f"**✅ Present ({len(present)})**")
+                                for a in present:
+                                    st.markdown(f"👤 {a.staff_name} — {a.role}")
+                            with col_a:
+                                st.markdown(f"**📨 Apologies ({len(apologies)})**")
+                                for a in apologies:
+                                    st.markdown(f"👤 {a.staff_name} — {a.role}")
+                        else:
+                            st.markdown('<div class="info-box">No attendance recorded.</div>', unsafe_allow_html=True)
+
+                    with arc3:
+                        actions = arc_children["pac_action_items"]
+                        if actions:
+                            for a in actions:
+                                css = "action-done" if a.complete else ""
+                                st.markdown(f'<div class="action-item {css}"><strong>{a.icon} {a.action}</strong><br><small>👤 {a.responsible_person} &nbsp;·&nbsp; Status: {a.status} &nbsp;·&nbsp; Due: {a.due_label}</small></div>', unsafe_allow_html=True)
+                        else:
+                            st.markdown('<div class="info-box">No action items recorded.</div>', unsafe_allow_html=True)
+
+                if check_admin():
+                    st.markdown("---")
+                    if st.button("↩ Reopen Meeting", key=f"reopen_{m.id}"):
+                        db_update("pac_meetings", {"status": "draft"}, {"id": m.id}, m.id)
+                        st.success("Meeting reopened and moved back to Draft Minutes status.")
+                        st.rerun()
@@ -0,0 +1,50 @@
+"""Admin diagnostics: this rerun's queries and timings, and the shared caches."""
+import streamlit as st
+
+from pac import dates
+from pac.services import init_cache, init_change_feed, init_export_cache
+from pac.synthesis_service import init_synthesis_jobs
+
+
+def render(recorder, this_run):
+    with st.expander("🩺 Diagnostics — this rerun"):
+        summary = this_run.summary()
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Supabase queries", summary["queries"])
+        c2.metric("Query time", f"{summary['query_ms']:.0f} ms")
+        c3.metric("Bytes returned", f"{summary['bytes'] / 1000:.1f} kB")
+        c4.metric("Rerun time", f"{summary['elapsed_ms']:.0f} ms")
+        by_table = this_run.by_table()
+        if by_table:
+            st.dataframe([{"table": t, "op": op, "count": a["count"], "total ms": round(a["ms"], 1), "max ms": round(a["max_ms"], 1),
+                           "rows": a["rows"], "bytes": a["bytes"]} for (t, op), a in sorted(by_table.items(), key=lambda kv: -kv[1]["ms"])],
+                         hide_index=True, use_container_width=True)
+        else:
+            st.caption("No queries this rerun — everything was served from the cache.")
+        st.markdown("**Render time by section**")
+        st.dataframe([{"section": k, "ms": v} for k, v in summary["sections"].items()], hide_index=True, use_container_width=True)
+        recent = [r.summary() for r in recorder.runs]
+        st.caption(f"Last {len(recent)} reruns: {sum(r['queries'] for r in recent) / max(1, len(recent)):.1f} queries and "
+                   f"{sum(r['elapsed_ms'] for r in recent) / max(1, len(recent)):.0f} ms on average · "
+                   f"{len(recorder.background.queries)} background queries, {len(recorder.background.llm_calls)} Claude calls")
+        st.download_button("⬇️ Export metrics (JSON lines)", recorder.export_jsonl(), file_name="pac_metrics.jsonl",
+                           mime="application/x-ndjson")
+
+    with st.expander("📊 Shared read model"):
+        stats = init_cache().stats()
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Entries", stats["entries"])
+        c2.metric("Cached rows", stats["rows"])
+        c3.metric("Hit rate", f"{stats['hits'] / max(1, stats['hits'] + stats['misses']):.0%}")
+        c4.metric("Coalesced loads", stats["coalesced"])
+        st.caption(f"{stats['loads']} loads · {stats['stale_loads']} discarded as stale · {stats['evictions']} evicted · {stats['in_flight']} in flight")
+        exports = init_export_cache().stats()
+        st.caption(f"Exports: {exports['entries']} documents ({exports['bytes'] / 1000:.0f} kB) · {exports['hits']} hits · {exports['misses']} renders")
+        jobs = init_synthesis_jobs().stats()
+        st.caption(f"Synthesis jobs: {jobs['queued']} queued · {jobs['running']} running · {jobs['done']} done · {jobs['failed']} failed")
+        st.caption(" · ".join(f"Date {name} cache: {info['currsize']} entries, "
+                              f"{info['hits'] / max(1, info['hits'] + info['misses']):.0%} hits"
+                              for name, info in dates.cache_info().items()))
+        change_feed = init_change_feed()
+        if change_feed:
+            st.json(change_feed.stats())
@@ -0,0 +1,375 @@
+"""Meeting detail view: header, admin controls and one fragment per section."""
+from datetime import date, datetime, timedelta
+
+import streamlit as st
+
+from pac.actions import cutoff, is_overdue
+from pac.data import (db_actions, db_agenda, db_attendance, db_delete, db_delete_meeting, db_docs, db_insert,
+                      db_meeting, db_minutes, db_reorder_agenda, db_update)
+from pac.dates import fmt_date
+from pac.ui import STATUS_COLORS, STATUS_LABELS, check_admin, export_controls
+
+# Each section of the meeting detail view is a fragment that reads its own rows
+# (from the cache), so an interaction inside one section reruns only that
+# section instead of the whole page. Only the selected section is rendered.
+# List rows are not fragments: every row button (remove, delete, update status)
+# changes the section's counts, headings or order, so the whole section reruns.
+
+@st.fragment
+def agenda_section(mid, m):
+    status = m.status
+    st.markdown('<div class="section-card">', unsafe_allow_html=True)
+    st.markdown("### 📋 Agenda Items")
+    if m.notice_text:
+        st.markdown(f'<div class="info-box">ℹ️ {m.notice_text}</div>', unsafe_allow_html=True)
+    st.markdown("""
+**Standard Agenda Order (DfE PAC Requirements):**
+1. Welcome & Acknowledgement of Country
+2. Apologies
+3. Confirmation of previous minutes
+4. Business arising from previous minutes
+5. Correspondence
+6. General business *(submitted items appear here)*
+7. Any other business
+8. Date of next meeting
+    """)
+    st.markdown("---")
+
+    items = db_agenda(mid)
+    if items:
+        st.markdown("**Submitted Agenda Items for General Business:**")
+        for item in items:
+            st.markdown(f"""
+            <div class="agenda-item">
+              <h4>{item.icon} {item.item_title}</h4>
+              <p>{item.item_description}</p>
+              <div class="submitter">Submitted by: {item.submitted_by} &nbsp;·&nbsp; Type: {item.item_type}</div>
+            </div>
+            """, unsafe_allow_html=True)
+            if check_admin():
+                if st.button("🗑️ Remove", key=f"del_ai_{item.id}"):
+                    db_delete("pac_agenda_items", {"id": item.id}, mid)
+                    st.rerun(scope="fragment")
+        if check_admin() and len(items) > 1:
+            with st.expander("↕️ Reorder agenda items"):
+                st.caption("Drag items into order, then save. All positions are written in one request.")
+                from streamlit_sortables import sort_items
+                by_label = {f"6.{i+1}  {item.item_title}": item for i, item in enumerate(items)}
+                new_order = sort_items(list(by_label), key=f"sort_ai_{mid}")
+                if st.button("💾 Save order", key=f"save_order_{mid}", disabled=new_order == list(by_label)):
+                    db_reorder_agenda(mid, [by_label[label].id for label in new_order])
+                    st.rerun(scope="fragment")
+    else:
+        st.markdown('<div class="info-box">No agenda items submitted yet.</div>', unsafe_allow_html=True)
+
+    if status in ["upcoming", "open"]:
+        st.markdown("---")
+        st.markdown("**➕ Submit an Agenda Item**")
+        st.markdown('<div class="info-box">All staff can submit items for general business consideration.</div>', unsafe_allow_html=True)
+        with st.form(f"agenda_form_{mid}", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+            with col1:
+                ai_name = st.text_input("Your name *")
+                ai_title = st.text_input("Agenda item title *")
+            with col2:
+                ai_type = st.selectbox("Item type", ["Information","Discussion","Decision","Presentation"])
+            ai_desc = st.text_area("Description / background (optional)")
+            if st.form_submit_button("Submit Agenda Item", type="primary", use_container_width=True):
+                if ai_name.strip() and ai_title.strip():
+                    # order_no is assigned by the database (migrations/002_agenda_order_no.sql).
+                    db_insert("pac_agenda_items", {
+                        "meeting_id": mid,
+                        "submitted_by": ai_name.strip(),
+                        "item_title": ai_title.strip(),
+                        "item_description": ai_desc.strip(),
+                        "item_type": ai_type
+                    })
+                    st.success("✅ Agenda item submitted!")
+                    st.rerun(scope="fragment")
+                else:
+                    st.warning("Please enter your name and item title.")
+    elif status == "finalised":
+        st.markdown('<div class="warn-box">⚠️ This meeting is finalised. No more agenda items can be submitted.</div>', unsafe_allow_html=True)
+
+    if check_admin() and items:
+        st.markdown("---")
+        st.markdown("**📄 Export Agenda**")
+        export_controls("agenda", m, items, f"agenda_export_{mid}")
+
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def attendance_section(mid, m):
+    st.markdown('<div class="section-card">', unsafe_allow_html=True)
+    st.markdown("### 👥 Attendance Register")
+    attendance = db_attendance(mid)
+
+    if check_admin():
+        with st.expander("➕ Add Staff Member to Register"):
+            with st.form(f"att_form_{mid}", clear_on_submit=True):
+                col1, col2 = st.columns(2)
+                with col1:
+                    att_name = st.text_input("Staff name *")
+                    att_role = st.text_input("Role / position")
+                with col2:
+                    att_status = st.selectbox("Status", ["Present","Apology","Absent"])
+                if st.form_submit_button("Add to Register", type="primary"):
+                    if att_name.strip():
+                        db_insert("pac_attendance", {
+                            "meeting_id": mid,
+                            "staff_name": att_name.strip(),
+                            "role": att_role.strip(),
+                            "attended": att_status == "Present",
+                            "apology": att_status == "Apology"
+                        })
+                        st.rerun(scope="fragment")
+
+    if attendance:
+        present = [a for a in attendance if a.attended]
+        apologies = [a for a in attendance if a.apology]
+        absent = [a for a in attendance if a.absent]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Present", len(present))
+        col2.metric("Apologies", len(apologies))
+        col3.metric("Absent", len(absent))
+        st.markdown("---")
+        for group_label, group_data in [("✅ Present", present), ("📨 Apologies", apologies), ("❌ Absent", absent)]:
+            if group_data:
+                st.markdown(f"**{group_label}**")
+                for a in group_data:
+                    c1, c2 = st.columns([4,1])
+                    with c1:
+                        st.markdown(f"👤 **{a.staff_name}** — {a.role}")
+                    with c2:
+                        if check_admin():
+                            if st.button("✕", key=f"del_att_{a.id}"):
+                                db_delete("pac_attendance", {"id": a.id}, mid)
+                                st.rerun(scope="fragment")
+    else:
+        st.markdown('<div class="info-box">No attendance recorded yet.</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def minutes_section(mid, m):
+    st.markdown('<div class="section-card">', unsafe_allow_html=True)
+    st.markdown("### 📝 Meeting Minutes")
+    mins = db_minutes(mid)
+
+    if check_admin():
+        # Only admins see the synthesis panel, so only they load it (and the Anthropic SDK).
+        from pac.synthesis_service import synthesis_panel
+        synthesis_panel(mid, m)
+
+        st.markdown("---")
+        st.markdown("**✏️ Record / Edit Minutes**")
+        if st.session_state.get(f"mins_override_{mid}"):
+            mins_content = st.session_state.pop(f"mins_override_{mid}")
+        elif mins:
+            mins_content = mins.content
+        else:
+            items = db_agenda(mid)
+            attendance = db_attendance(mid)
+            present_names = ", ".join([a.staff_name for a in attendance if a.attended]) or "—"
+            apology_names = ", ".join([a.staff_name for a in attendance if a.apology]) or "Nil"
+            agenda_items_text = ""
+            for i, item in enumerate(items):
+                agenda_items_text += f"\n6.{i+1} {item.item_title}\n     Discussion: \n     Outcome: \n"
+            mins_content = f"""PERSONNEL ADVISORY COMMITTEE\nCowandilla Learning Centre\n{m.meeting_type.upper()} MEETING MINUTES\n\nDate: {m.date_label}\nTime: {m.time_label}\nLocation: {m.location}\nChair: {m.chair}\n\n════════════════════════════════════════════\n\n1. WELCOME & ACKNOWLEDGEMENT OF COUNTRY\n   The Chair opened the meeting at [TIME] and acknowledged the Kaurna people as the traditional custodians of the land on which we meet.\n\n2. APOLOGIES\n   Apologies received from: {apology_names}\n   Present: {present_names}\n\n3. CONFIRMATION OF PREVIOUS MINUTES\n   \n\n4. BUSINESS ARISING FROM PREVIOUS MINUTES\n   \n\n5. CORRESPONDENCE\n   Inwards: \n   Outwards: \n\n6. GENERAL BUSINESS\n{agenda_items_text}\n\n7. ANY OTHER BUSINESS\n   \n\n8. DATE OF NEXT MEETING\n   The next meeting will be held on: \n\n════════════════════════════════════════════\nMeeting closed at: [TIME]\nMinutes prepared by: \nDate prepared: {fmt_date(date.today())}\n"""
+
+        mins_edit = st.text_area("Minutes content", value=mins_content, height=500, key=f"mins_edit_{mid}")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("💾 Save Draft", key=f"save_draft_{mid}", use_container_width=True):
+                if mins:
+                    db_update("pac_minutes", {"content": mins_edit, "status": "draft"}, {"id": mins.id}, mid)
+                else:
+                    db_insert("pac_minutes", {"meeting_id": mid, "content": mins_edit, "status": "draft"})
+                st.success("Draft saved.")
+                st.rerun(scope="fragment")
+        with col2:
+            if st.button("✅ Finalise Minutes", key=f"finalise_{mid}", use_container_width=True, type="primary"):
+                if mins:
+                    db_update("pac_minutes", {"content": mins_edit, "status": "finalised", "finalised_at": datetime.now().isoformat()}, {"id": mins.id}, mid)
+                else:
+                    db_insert("pac_minutes", {"meeting_id": mid, "content": mins_edit, "status": "finalised", "finalised_at": datetime.now().isoformat()})
+                db_update("pac_meetings", {"status": "finalised"}, {"id": mid}, mid)
+                st.success("✅ Minutes finalised — meeting moved to Archive.")
+                st.session_state.view = None
+                st.session_state.selected_meeting = None
+                st.rerun()
+        if mins_edit:
+            st.markdown("**📄 Export Minutes**")
+            export_controls("minutes", m, mins_edit, f"mins_export_{mid}")
+    else:
+        if mins:
+            if mins.finalised:
+                st.markdown('<div class="info-box">✅ These minutes have been finalised.</div>', unsafe_allow_html=True)
+            else:
+                st.markdown('<div class="warn-box">⏳ Minutes are in draft — not yet finalised.</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="minutes-box">{mins.content}</div>', unsafe_allow_html=True)
+            export_controls("minutes", m, mins.content, f"mins_export_{mid}")
+        else:
+            st.markdown('<div class="info-box">📝 Minutes not yet recorded. Check back after the meeting.</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+def action_row(mid, a):
+    overdue = " 🔴 **OVERDUE**" if is_overdue(a, cutoff()) else ""
+    st.markdown(f'<div class="action-item"><strong>{a.icon} {a.action}</strong>{overdue}<br><small>👤 {a.responsible_person} &nbsp;·&nbsp; 📅 Due: {a.due_label}</small></div>', unsafe_allow_html=True)
+    if check_admin():
+        c1, c2, c3 = st.columns([2,2,1])
+        with c1:
+            new_st = st.selectbox("Status", ["Pending","In Progress","Complete"], index=a.status_index, key=f"act_st_{a.id}")
+        with c2:
+            st.write(""); st.write("")
+            if st.button("Update", key=f"upd_act_{a.id}"):
+                db_update("pac_action_items", {"status": new_st}, {"id": a.id}, mid)
+                st.rerun(scope="fragment")
+        with c3:
+            st.write(""); st.write("")
+            if st.button("🗑️", key=f"del_act_{a.id}"):
+                db_delete("pac_action_items", {"id": a.id}, mid)
+                st.rerun(scope="fragment")
+
+
+@st.fragment
+def actions_section(mid, m):
+    st.markdown('<div class="section-card">', unsafe_allow_html=True)
+    st.markdown("### ✅ Action Items")
+    actions = db_actions(mid)
+
+    if check_admin():
+        with st.expander("➕ Add Action Item"):
+            with st.form(f"action_form_{mid}", clear_on_submit=True):
+                col1, col2 = st.columns(2)
+                with col1:
+                    act_text = st.text_area("Action *")
+                    act_person = st.text_input("Responsible person *")
+                with col2:
+                    act_due = st.date_input("Due date", value=date.today() + timedelta(weeks=4))
+                    act_status_sel = st.selectbox("Status", ["Pending","In Progress","Complete"])
+                if st.form_submit_button("Add Action", type="primary"):
+                    if act_text.strip() and act_person.strip():
+                        db_insert("pac_action_items", {"meeting_id": mid, "action": act_text.strip(), "responsible_person": act_person.strip(), "due_date": str(act_due), "status": act_status_sel})
+                        st.rerun(scope="fragment")
+
+    if actions:
+        pending_a = [a for a in actions if not a.complete]
+        done_a = [a for a in actions if a.complete]
+        if pending_a:
+            st.markdown(f"**Pending / In Progress ({len(pending_a)})**")
+            for a in pending_a:
+                action_row(mid, a)
+        if done_a:
+            st.markdown(f"**Completed ({len(done_a)})**")
+            for a in done_a:
+                st.markdown(f'<div class="action-item action-done"><strong>✅ {a.action}</strong><br><small>👤 {a.responsible_person} &nbsp;·&nbsp; Due: {a.due_label}</small></div>', unsafe_allow_html=True)
+    else:
+        st.markdown('<div class="info-box">No action items recorded yet.</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def documents_section(mid, m):
+    st.markdown('<div class="section-card">', unsafe_allow_html=True)
+    st.markdown("### 📎 Supporting Documents")
+    docs = db_docs(mid)
+
+    if check_admin():
+        with st.expander("➕ Add Document Link"):
+            with st.form(f"doc_form_{mid}", clear_on_submit=True):
+                doc_name = st.text_input("Document name *")
+                doc_url = st.text_input("URL / link *")
+                doc_desc = st.text_input("Description (optional)")
+                if st.form_submit_button("Add Document", type="primary"):
+                    if doc_name.strip() and doc_url.strip():
+                        db_insert("pac_documents", {"meeting_id": mid, "document_name": doc_name.strip(), "document_url": doc_url.strip(), "description": doc_desc.strip()})
+                        st.rerun(scope="fragment")
+
+    if docs:
+        for d in docs:
+            c1, c2 = st.columns([5,1])
+            with c1:
+                st.markdown(f"📄 **[{d.document_name}]({d.document_url})** — {d.description}")
+            with c2:
+                if check_admin():
+                    if st.button("🗑️", key=f"del_doc_{d.id}"):
+                        db_delete("pac_documents", {"id": d.id}, mid)
+                        st.rerun(scope="fragment")
+    else:
+        st.markdown('<div class="info-box">No documents attached to this meeting.</div>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+SECTIONS = {
+    "📋 Agenda": agenda_section,
+    "👥 Attendance": attendance_section,
+    "📝 Minutes": minutes_section,
+    "✅ Actions": actions_section,
+    "📎 Documents": documents_section,
+}
+
+
+def render(mid):
+    m = db_meeting(mid)
+    if not m:
+        st.error("Meeting not found.")
+        return
+    st.markdown("---")
+    if st.button("← Back to all meetings"):
+        st.session_state.view = None
+        st.session_state.selected_meeting = None
+        st.rerun()
+
+    status = m.status
+    badge = STATUS_COLORS.get(status, "badge-upcoming")
+    label = STATUS_LABELS.get(status, status.title())
+
+    st.markdown(f"""
+    <div style="background:linear-gradient(135deg,#1a2e4a,#2d4a6e);color:white;padding:1.5rem;border-radius:10px;margin-bottom:1rem;">
+      <div style="display:flex;justify-content:space-between;align-items:center">
+        <div>
+          <h2 style="margin:0;font-size:1.4rem;">{m.meeting_type} Meeting</h2>
+          <p style="margin:0.25rem 0 0;opacity:0.8;">{m.date_label} &nbsp;·&nbsp; {m.time_label} &nbsp;·&nbsp; {m.location}</p>
+          <p style="margin:0.25rem 0 0;opacity:0.7;font-size:0.85rem;">Chair: {m.chair}</p>
+        </div>
+        <span class="status-badge {badge}" style="font-size:0.85rem;">{label}</span>
+      </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if check_admin():
+        col_s1, col_s2, col_s3 = st.columns([2,1,1])
+        with col_s1:
+            new_status = st.selectbox("Update status", ["upcoming","open","draft","finalised"],
+                index=["upcoming","open","draft","finalised"].index(status) if status in ["upcoming","open","draft","finalised"] else 0,
+                key=f"status_{mid}")
+        with col_s2:
+            st.write(""); st.write("")
+            if st.button("Update Status", key=f"upd_status_{mid}"):
+                db_update("pac_meetings", {"status": new_status}, {"id": mid}, mid)
+                st.success("Status updated.")
+                st.rerun()
+        with col_s3:
+            st.write(""); st.write("")
+            if st.button("🗑️ Delete Meeting", key=f"del_{mid}", type="secondary"):
+                st.session_state[f"confirm_del_{mid}"] = True
+
+        if st.session_state.get(f"confirm_del_{mid}"):
+            st.warning("⚠️ Are you sure? This will delete the meeting and all related data.")
+            c1, c2 = st.columns(2)
+            with c1:
+                if st.button("Yes, delete", key=f"yes_del_{mid}", type="primary"):
+                    db_delete_meeting(mid)
+                    st.session_state.view = None
+                    st.session_state.selected_meeting = None
+                    st.rerun()
+            with c2:
+                if st.button("Cancel", key=f"no_del_{mid}"):
+                    st.session_state[f"confirm_del_{mid}"] = False
+                    st.rerun()
+
+    section = st.radio("Section", list(SECTIONS), key=f"section_{mid}", horizontal=True, label_visibility="collapsed")
+    SECTIONS[section](mid, m)
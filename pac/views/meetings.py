@@ -0,0 +1,75 @@
+"""All Meetings: the active meeting list, scheduling, and the meeting detail view."""
+from datetime import date, datetime, timedelta
+
+import streamlit as st
+
+from pac.data import ACTIVE, MEETING_PAGE_SIZE, db_insert, db_meeting_page
+from pac.ui import STATUS_COLORS, STATUS_LABELS, check_admin, page_controls, page_index
+
+
+def render():
+    if check_admin():
+        with st.expander("➕ Schedule a New Meeting", expanded=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                new_date = st.date_input("Meeting date", value=date.today() + timedelta(days=14), key="nm_date")
+                new_time = st.time_input("Start time", value=datetime.strptime("09:30", "%H:%M").time(), key="nm_time")
+            with col2:
+                new_loc = st.text_input("Location", value="LBU Meeting Room", key="nm_loc")
+                new_chair = st.text_input("Chair", key="nm_chair")
+            new_type = st.selectbox("Meeting type", ["Ordinary", "Special", "Annual"], key="nm_type")
+            new_notice = st.text_area("Notice / Agenda preamble (optional)", key="nm_notice")
+            if st.button("📅 Create Meeting", type="primary", use_container_width=True):
+                if new_chair.strip():
+                    db_insert("pac_meetings", {
+                        "meeting_date": str(new_date),
+                        "start_time": str(new_time),
+                        "location": new_loc,
+                        "chair": new_chair,
+                        "meeting_type": new_type,
+                        "notice_text": new_notice,
+                        "status": "upcoming"
+                    })
+                    st.success("Meeting scheduled!")
+                    st.rerun()
+                else:
+                    st.warning("Please enter a chair name.")
+
+    col_r, _ = st.columns([2, 3])
+    with col_r:
+        st.date_input("Filter by date range", value=[], key="all_range", format="DD/MM/YYYY",
+                      on_change=lambda: st.session_state.update(all_page=1))
+
+    all_since, all_until = (tuple(st.session_state.get("all_range") or ()) + (None, None))[:2]
+    active_meetings, active_total = db_meeting_page(ACTIVE, page_index("all_page"), all_since, all_until)
+    if not active_total:
+        st.markdown('<div class="info-box">📋 No active meetings. Finalised meetings are in the 🗄️ Archive tab.</div>', unsafe_allow_html=True)
+    else:
+        page_controls(active_total, MEETING_PAGE_SIZE, "all_page")
+        for m in active_meetings:
+            badge = STATUS_COLORS.get(m.status, "badge-upcoming")
+            label = STATUS_LABELS.get(m.status, m.status.title())
+            card_class = m.status
+
+            st.markdown(f"""
+            <div class="meeting-card {card_class}">
+              <div style="display:flex;justify-content:space-between;align-items:flex-start">
+                <h3>📋 {m.meeting_type} Meeting — {m.date_label}</h3>
+                <span class="status-badge {badge}">{label}</span>
+              </div>
+              <div class="meta">
+                <span>⏰ {m.time_label}</span>
+                <span>📍 {m.location}</span>
+                <span>👤 Chair: {m.chair}</span>
+              </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            if st.button("Open Meeting →", key=f"open_{m.id}"):
+                st.session_state.selected_meeting = m.id
+                st.session_state.view = "meeting"
+
+    # ── MEETING DETAIL VIEW ──────────────────────────────────────────────────────
+    if st.session_state.get("view") == "meeting" and st.session_state.get("selected_meeting"):
+        from pac.views import meeting
+        meeting.render(st.session_state.selected_meeting)
@@ -0,0 +1,29 @@
+"""Full-text search over minutes, agenda items and actions, shown above the views."""
+import streamlit as st
+
+from pac.data import db_search
+from pac.dates import fmt_date
+
+SEARCH_KINDS = {"minutes": "📝 Minutes", "agenda": "📋 Agenda item", "action": "✅ Action"}
+
+
+def render():
+    search_q = st.text_input("🔎 Search minutes, agenda items and actions", key="search_q",
+                             placeholder='e.g. leave policy, "workload review", -draft')
+    if not search_q.strip():
+        return
+    hits = db_search(search_q)
+    with st.expander(f"{len(hits)} result{'s' if len(hits) != 1 else ''} for “{search_q.strip()}”", expanded=True):
+        if not hits:
+            st.markdown('<div class="info-box">No matches. Try fewer or different words.</div>', unsafe_allow_html=True)
+        for i, h in enumerate(hits):
+            c1, c2 = st.columns([5,1])
+            with c1:
+                st.markdown(f"**{SEARCH_KINDS.get(h['kind'], h['kind'])}** · {h.get('meeting_type') or 'Ordinary'} Meeting — {fmt_date(h.get('meeting_date'))}  \n{h.get('snippet','')}")
+            with c2:
+                if st.button("Open →", key=f"search_open_{i}_{h['kind']}_{h['item_id']}"):
+                    # The meeting opens in the All Meetings view.
+                    st.session_state.nav = "meetings"
+                    st.session_state.selected_meeting = h["meeting_id"]
+                    st.session_state.view = "meeting"
+                    st.rerun()
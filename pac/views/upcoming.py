@@ -0,0 +1,42 @@
+"""Upcoming Meetings: the next meetings with their submitted agenda items."""
+import streamlit as st
+
+from pac.data import MEETING_PAGE_SIZE, UPCOMING, db_children, db_meeting_page
+from pac.dates import days_until
+from pac.ui import page_controls, page_index
+
+
+def render():
+    # Not windowed by date: an upcoming or open meeting stays listed however old
+    # its date, and undated ones come first (newest date first, nulls first).
+    upcoming, upcoming_total = db_meeting_page(UPCOMING, page_index("up_page"))
+    # The list shows agenda items, so those are loaded in bulk up front.
+    agenda = db_children("pac_agenda_items", [m.id for m in upcoming])
+
+    if not upcoming_total:
+        st.markdown('<div class="info-box">No upcoming meetings scheduled.</div>', unsafe_allow_html=True)
+    else:
+        page_controls(upcoming_total, MEETING_PAGE_SIZE, "up_page")
+        for m in upcoming:
+            days_to_go = days_until(m.date)
+            days_text = f"({days_to_go} days away)" if days_to_go is not None and days_to_go > 0 else ("(today!)" if days_to_go == 0 else "")
+
+            st.markdown(f"""
+            <div class="meeting-card upcoming">
+              <h3>📋 {m.meeting_type} Meeting — {m.date_label} {days_text}</h3>
+              <div class="meta">
+                <span>⏰ {m.time_label}</span>
+                <span>📍 {m.location}</span>
+                <span>👤 Chair: {m.chair}</span>
+              </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            items = agenda[m.id]
+            if items:
+                st.markdown(f"**Agenda items submitted ({len(items)}):**")
+                for item in items:
+                    st.markdown(f"  - {item.item_title} *(submitted by {item.submitted_by})*")
+            else:
+                st.markdown("*No agenda items submitted yet.*")
+            st.markdown("---")
@@ -0,0 +1,73 @@
+"""ChangeFeed driven through LocalEventSource: no network, no Supabase.
+
+    python -m pytest tests
+"""
+from pac.cache import MISSING, TTLCache
+from pac.models import record, records
+from pac.realtime import ChangeFeed, LocalEventSource
+
+MID = "m1"
+
+
+def by_meeting(r):
+    return r.get("meeting_id") == MID
+
+
+def connected_feed():
+    cache = TTLCache(ttl=60.0, records=record)
+    source = LocalEventSource()
+    feed = ChangeFeed(cache, source).start()
+    cache.set(("pac_action_items", MID), records("pac_action_items", [
+        {"id": 1, "meeting_id": MID, "action": "Roster", "status": "Pending", "created_at": "2025-01-01"},
+        {"id": 2, "meeting_id": MID, "action": "Budget", "status": "Pending", "created_at": "2025-01-02"},
+    ]), by_meeting, lambda r: r.get("created_at"))
+    cache.set(("pac_meetings", MID), record("pac_meetings", {"id": MID, "status": "upcoming", "meeting_type": "General"}))
+    return cache, source, feed
+
+
+def actions(cache):
+    return [(a.id, a.status) for a in cache.get(("pac_action_items", MID))]
+
+
+def test_connect_disables_ttl():
+    cache, source, feed = connected_feed()
+    assert feed.connected and cache.ttl is None
+
+
+def test_insert_update_delete_patch_cached_rows():
+    cache, source, feed = connected_feed()
+    source.emit("pac_action_items", "INSERT", {"id": 3, "meeting_id": MID, "action": "Leave", "status": "Pending",
+                                               "created_at": "2025-01-03"})
+    assert actions(cache) == [(1, "Pending"), (2, "Pending"), (3, "Pending")]
+
+    source.emit("pac_action_items", "UPDATE", {"id": 1, "meeting_id": MID, "action": "Roster", "status": "Complete",
+                                               "created_at": "2025-01-01"})
+    assert actions(cache) == [(1, "Complete"), (2, "Pending"), (3, "Pending")]
+
+    source.emit("pac_action_items", "DELETE", old_record={"id": 2})
+    assert actions(cache) == [(1, "Complete"), (3, "Pending")]
+
+    source.emit("pac_meetings", "UPDATE", {"id": MID, "status": "open", "meeting_type": "General"})
+    assert cache.get(("pac_meetings", MID)).status == "open"
+    assert feed.events == 4
+
+
+def test_other_rows_and_events_are_ignored():
+    cache, source, feed = connected_feed()
+    source.emit("pac_action_items", "INSERT", {"id": 9, "meeting_id": "m2", "status": "Pending"})
+    source.emit("other_table", "INSERT", {"id": 10})
+    source.emit("pac_action_items", "TRUNCATE")
+    source.emit("pac_action_items", "UPDATE", {"status": "Complete"})
+    assert actions(cache) == [(1, "Pending"), (2, "Pending")]
+    assert feed.events == 1
+
+
+def test_disconnect_restores_ttl_and_clears():
+    cache, source, feed = connected_feed()
+    feed.stop()
+    assert not feed.connected and cache.ttl == 60.0
+    assert len(cache) == 0
+    assert cache.get(("pac_action_items", MID)) is MISSING
+
+    source.emit("pac_action_items", "INSERT", {"id": 3, "meeting_id": MID, "status": "Pending"})
+    assert feed.events == 0